@@ -5,18 +5,31 @@ Displays on-duty hospitals for different medical specialties in Athens, Greece
 Updates daily at 08:00
 """
 
+import asyncio
 import datetime
+import functools
+import io
+import itertools
+import logging
+import operator
+import os
+import sys
 import time
-import json
+import httpx
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter, Retry
 from typing import Dict, List, Optional
-from dataclasses import dataclass, asdict
-from bs4 import BeautifulSoup
-import schedule
+from dataclasses import dataclass, field
+from lxml import html as lxml_html
+from lxml.cssselect import CSSSelector
 from moh_scraper import MOHHospitalScraper, Hospital as MOHHospital
 
+logger = logging.getLogger(__name__)
 
-@dataclass
+
+@dataclass(slots=True)
 class Hospital:
     """Represents a hospital with its details"""
     name: str
@@ -27,6 +40,137 @@ class Hospital:
     on_duty_date: str
     time_slot: str = ""
 
+    # Lowercased forms precomputed once so searches skip per-query case folding
+    specialty_lc: str = field(init=False, repr=False)
+    area_lc: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.specialty_lc = self.specialty.lower()
+        self.area_lc = self.area.lower()
+
+
+# Pre-built separators for the display output
+_DISPLAY_RULE = '=' * 70
+_CARD_RULE = '─' * 68
+
+# Selectors for the xo.gr scrape, compiled once instead of per element
+_SEL_ITEM = CSSSelector('div.hospital-item')
+_SEL_NAME = CSSSelector('h3')
+_SEL_SPEC = CSSSelector('span.specialty')
+_SEL_ADDR = CSSSelector('span.address')
+_SEL_PHONE = CSSSelector('span.phone')
+_SEL_AREA = CSSSelector('span.area')
+
+
+@functools.lru_cache(maxsize=2)
+def _sample_data_for(day: datetime.date) -> tuple:
+    """Build the sample hospital list for a given day (cached per day)"""
+    today = day.isoformat()
+
+    return (
+        Hospital(
+            name="Γενικό Νοσοκομείο Αθηνών «Ιπποκράτειο»",
+            specialty="Γενική Ιατρική / General Medicine",
+            address="Βασ. Σοφίας 114, Αθήνα",
+            phone="213 2088000",
+            area="Κέντρο Αθήνας",
+            on_duty_date=today
+        ),
+        Hospital(
+            name="Γενικό Νοσοκομείο Αθηνών «Λαϊκό»",
+            specialty="Χειρουργική / Surgery",
+            address="Αγίου Θωμά 17, Γουδή",
+            phone="213 2061000",
+            area="Γουδή",
+            on_duty_date=today
+        ),
+        Hospital(
+            name="Γενικό Νοσοκομείο Αθηνών «Ο Ευαγγελισμός»",
+            specialty="Καρδιολογία / Cardiology",
+            address="Υψηλάντου 45-47, Αθήνα",
+            phone="213 2041000",
+            area="Κολωνάκι",
+            on_duty_date=today
+        ),
+        Hospital(
+            name="Γενικό Νοσοκομείο Αθηνών «Αλεξάνδρα»",
+            specialty="Μαιευτική - Γυναικολογία / Obstetrics - Gynecology",
+            address="Βασ. Σοφίας 80, Αθήνα",
+            phone="213 3162000",
+            area="Κέντρο Αθήνας",
+            on_duty_date=today
+        ),
+        Hospital(
+            name="Παίδων «Αγία Σοφία»",
+            specialty="Παιδιατρική / Pediatrics",
+            address="Θηβών & Παπαδιαμαντοπούλου, Γουδή",
+            phone="213 2013000",
+            area="Γουδή",
+            on_duty_date=today
+        ),
+        Hospital(
+            name="Αττικό Νοσοκομείο",
+            specialty="Ορθοπεδική / Orthopedics",
+            address="Ρίμινι 1, Χαϊδάρι",
+            phone="210 5831000",
+            area="Χαϊδάρι",
+            on_duty_date=today
+        ),
+        Hospital(
+            name="ΚΑΤ - Γενικό Νοσοκομείο Αττικής",
+            specialty="Τραυματολογία / Trauma",
+            address="Νίκης 2, Κηφισιά",
+            phone="213 2086000",
+            area="Κηφισιά",
+            on_duty_date=today
+        ),
+        Hospital(
+            name="«Σωτηρία» - Νοσοκομείο Θώρακος Αθηνών",
+            specialty="Πνευμονολογία / Pulmonology",
+            address="Μεσογείων 152, Αθήνα",
+            phone="213 2057000",
+            area="Αμπελόκηποι",
+            on_duty_date=today
+        ),
+        Hospital(
+            name="Ψυχιατρικό Νοσοκομείο Αττικής",
+            specialty="Ψυχιατρική / Psychiatry",
+            address="Ρίμινι & Χαϊδαρίου, Χαϊδάρι",
+            phone="213 2047000",
+            area="Χαϊδάρι",
+            on_duty_date=today
+        ),
+    )
+
+
+def _hospital_to_dict(h: Hospital) -> Dict[str, str]:
+    """Serialize a Hospital to a plain dict without asdict's reflection/deepcopy"""
+    return {
+        'name': h.name,
+        'specialty': h.specialty,
+        'address': h.address,
+        'phone': h.phone,
+        'area': h.area,
+        'on_duty_date': h.on_duty_date,
+        'time_slot': h.time_slot,
+    }
+
+
+def _parse_hospital_element(element) -> Optional[Hospital]:
+    """Parse a single hospital <div> into a Hospital, or None on bad markup"""
+    try:
+        return Hospital(
+            name=_SEL_NAME(element)[0].text_content().strip(),
+            specialty=_SEL_SPEC(element)[0].text_content().strip(),
+            address=_SEL_ADDR(element)[0].text_content().strip(),
+            phone=_SEL_PHONE(element)[0].text_content().strip(),
+            area=_SEL_AREA(element)[0].text_content().strip(),
+            on_duty_date=datetime.date.today().isoformat()
+        )
+    except Exception as e:
+        logger.warning("Error parsing hospital element: %s", e)
+        return None
+
 
 class AthensHospitalService:
     """Service to fetch and display on-duty hospitals in Athens"""
@@ -35,22 +179,52 @@ class AthensHospitalService:
         self.hospitals: List[Hospital] = []
         self.last_update: Optional[datetime.datetime] = None
         self.moh_scraper = MOHHospitalScraper()
+        self._ttl_minutes = 60
 
-    def fetch_hospital_data(self) -> List[Hospital]:
+        # Single session with keep-alive so repeated fetches to the same
+        # host reuse the TCP/TLS connection instead of re-handshaking
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+        })
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self):
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
+
+    def fetch_hospital_data(self, force: bool = False) -> List[Hospital]:
         """
         Fetch on-duty hospital data from available sources
 
         Priority:
         1. Official Ministry of Health PDF/DOC files
-        2. Fallback to sample data for demonstration
+        2. Web fallbacks (xo.gr / vrisko.gr), fetched concurrently
+        3. Fallback to sample data for demonstration
+
+        Pass force=True to bypass the TTL cache and re-scrape.
         """
 
+        # Serve cached data while it is still fresh - the MOH scrape
+        # (PDF download + parse) is by far the dominant cost here
+        if (not force and self.hospitals and self.last_update
+                and (datetime.datetime.now() - self.last_update).total_seconds()
+                < self._ttl_minutes * 60):
+            logger.info("Χρήση δεδομένων από την προσωρινή μνήμη (TTL)")
+            return self.hospitals
+
         # Method 1: Try to fetch from Ministry of Health official files
         try:
-            print("  Fetching from Ministry of Health official files...")
+            logger.info("Fetching from Ministry of Health official files...")
             moh_hospitals = self.moh_scraper.get_today_schedule()
             if moh_hospitals:
-                print(f"  ✓ Successfully fetched {len(moh_hospitals)} entries from MOH")
+                logger.info("Fetched %d entries from MOH", len(moh_hospitals))
                 # Convert MOH Hospital objects to local Hospital objects
                 hospitals = []
                 for moh_h in moh_hospitals:
@@ -65,155 +239,110 @@ class AthensHospitalService:
                     ))
                 return hospitals
         except Exception as e:
-            print(f"  ✗ Error fetching from Ministry of Health: {e}")
+            logger.error("Error fetching from Ministry of Health: %s", e)
+
+        # Method 2: Try the web fallbacks, both sites fetched in parallel
+        try:
+            logger.info("Fetching from web fallbacks (xo.gr / vrisko.gr)...")
+            hospitals = []
+            for result in asyncio.run(self._fetch_all_fallbacks()):
+                if isinstance(result, Exception):
+                    logger.error("Fallback fetch failed: %s", result)
+                else:
+                    hospitals.extend(result)
+            if hospitals:
+                return hospitals
+        except Exception as e:
+            logger.error("Error fetching web fallbacks: %s", e)
 
         # Fallback: Return sample data for demonstration
-        print("  Using sample data as fallback...")
+        logger.info("Using sample data as fallback...")
         return self._get_sample_data()
 
+    @staticmethod
+    def _parse_xo_content(content: bytes) -> List[Hospital]:
+        """Parse an xo.gr result page into Hospital objects"""
+        # Parse bytes directly with lxml's C tokenizer - much faster than
+        # html.parser and skips a redundant decode/re-encode round trip
+        tree = lxml_html.fromstring(content)
+
+        # Parse hospital data from HTML (structure depends on actual website)
+        # This is a template - adjust selectors based on actual HTML structure
+        hospital_elements = _SEL_ITEM(tree)
+
+        # lxml text extraction releases the GIL, so parsing the elements in
+        # a thread pool scales on large result pages
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            hospitals = [
+                h for h in executor.map(_parse_hospital_element, hospital_elements)
+                if h is not None
+            ]
+
+        return hospitals
+
     def _fetch_from_xo_gr(self) -> List[Hospital]:
         """Fetch data from xo.gr"""
         url = "https://www.xo.gr/hospitals-on-duty/athens/"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-        }
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = self.session.get(url, timeout=10)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        hospitals = []
-
-        # Parse hospital data from HTML (structure depends on actual website)
-        # This is a template - adjust selectors based on actual HTML structure
-        hospital_elements = soup.find_all('div', class_='hospital-item')
-
-        for element in hospital_elements:
-            try:
-                hospital = Hospital(
-                    name=element.find('h3').text.strip(),
-                    specialty=element.find('span', class_='specialty').text.strip(),
-                    address=element.find('span', class_='address').text.strip(),
-                    phone=element.find('span', class_='phone').text.strip(),
-                    area=element.find('span', class_='area').text.strip(),
-                    on_duty_date=datetime.date.today().isoformat()
-                )
-                hospitals.append(hospital)
-            except Exception as e:
-                print(f"Error parsing hospital element: {e}")
-                continue
-
-        return hospitals
+        return self._parse_xo_content(response.content)
 
     def _fetch_from_vrisko(self) -> List[Hospital]:
         """Fetch data from vrisko.gr"""
-        url = "https://www.vrisko.gr/en/hospital-duties/athens/all-clinics/"
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
-        }
+        # No selectors implemented yet - skip the fetch entirely instead of
+        # downloading and parsing a page whose result would be thrown away
+        logger.info("vrisko.gr parser not implemented; skipping")
+        return []
 
-        response = requests.get(url, headers=headers, timeout=10)
+    async def _fetch_xo_async(self, client: httpx.AsyncClient) -> List[Hospital]:
+        """Async variant of _fetch_from_xo_gr for the concurrent fallback path"""
+        url = "https://www.xo.gr/hospitals-on-duty/athens/"
+
+        response = await client.get(url)
         response.raise_for_status()
 
-        soup = BeautifulSoup(response.text, 'html.parser')
-        hospitals = []
+        return self._parse_xo_content(response.content)
 
-        # Parse hospital data (adjust based on actual structure)
-        # This is a template
+    async def _fetch_vrisko_async(self, client: httpx.AsyncClient) -> List[Hospital]:
+        """Async variant of _fetch_from_vrisko for the concurrent fallback path"""
+        return self._fetch_from_vrisko()
 
-        return hospitals
+    async def _fetch_all_fallbacks(self):
+        """Fetch all web fallback sources concurrently
 
-    def _get_sample_data(self) -> List[Hospital]:
+        Latency is max-of-RTTs instead of sum-of-RTTs across the sources.
+        """
+        async with httpx.AsyncClient(
+            headers={
+                'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
+            },
+            timeout=10,
+            follow_redirects=True,
+        ) as client:
+            return await asyncio.gather(
+                self._fetch_xo_async(client),
+                self._fetch_vrisko_async(client),
+                return_exceptions=True,
+            )
+
+    @staticmethod
+    def _get_sample_data() -> List[Hospital]:
         """Return sample hospital data for demonstration"""
-        today = datetime.date.today().isoformat()
-
-        return [
-            Hospital(
-                name="Γενικό Νοσοκομείο Αθηνών «Ιπποκράτειο»",
-                specialty="Γενική Ιατρική / General Medicine",
-                address="Βασ. Σοφίας 114, Αθήνα",
-                phone="213 2088000",
-                area="Κέντρο Αθήνας",
-                on_duty_date=today
-            ),
-            Hospital(
-                name="Γενικό Νοσοκομείο Αθηνών «Λαϊκό»",
-                specialty="Χειρουργική / Surgery",
-                address="Αγίου Θωμά 17, Γουδή",
-                phone="213 2061000",
-                area="Γουδή",
-                on_duty_date=today
-            ),
-            Hospital(
-                name="Γενικό Νοσοκομείο Αθηνών «Ο Ευαγγελισμός»",
-                specialty="Καρδιολογία / Cardiology",
-                address="Υψηλάντου 45-47, Αθήνα",
-                phone="213 2041000",
-                area="Κολωνάκι",
-                on_duty_date=today
-            ),
-            Hospital(
-                name="Γενικό Νοσοκομείο Αθηνών «Αλεξάνδρα»",
-                specialty="Μαιευτική - Γυναικολογία / Obstetrics - Gynecology",
-                address="Βασ. Σοφίας 80, Αθήνα",
-                phone="213 3162000",
-                area="Κέντρο Αθήνας",
-                on_duty_date=today
-            ),
-            Hospital(
-                name="Παίδων «Αγία Σοφία»",
-                specialty="Παιδιατρική / Pediatrics",
-                address="Θηβών & Παπαδιαμαντοπούλου, Γουδή",
-                phone="213 2013000",
-                area="Γουδή",
-                on_duty_date=today
-            ),
-            Hospital(
-                name="Αττικό Νοσοκομείο",
-                specialty="Ορθοπεδική / Orthopedics",
-                address="Ρίμινι 1, Χαϊδάρι",
-                phone="210 5831000",
-                area="Χαϊδάρι",
-                on_duty_date=today
-            ),
-            Hospital(
-                name="ΚΑΤ - Γενικό Νοσοκομείο Αττικής",
-                specialty="Τραυματολογία / Trauma",
-                address="Νίκης 2, Κηφισιά",
-                phone="213 2086000",
-                area="Κηφισιά",
-                on_duty_date=today
-            ),
-            Hospital(
-                name="«Σωτηρία» - Νοσοκομείο Θώρακος Αθηνών",
-                specialty="Πνευμονολογία / Pulmonology",
-                address="Μεσογείων 152, Αθήνα",
-                phone="213 2057000",
-                area="Αμπελόκηποι",
-                on_duty_date=today
-            ),
-            Hospital(
-                name="Ψυχιατρικό Νοσοκομείο Αττικής",
-                specialty="Ψυχιατρική / Psychiatry",
-                address="Ρίμινι & Χαϊδαρίου, Χαϊδάρι",
-                phone="213 2047000",
-                area="Χαϊδάρι",
-                on_duty_date=today
-            ),
-        ]
+        return list(_sample_data_for(datetime.date.today()))
 
     def update_data(self):
         """Update hospital data"""
-        print(f"\n{'='*60}")
-        print(f"Ενημέρωση δεδομένων...")
-        print(f"Ώρα: {datetime.datetime.now().strftime('%d/%m/%Y %H:%M:%S')}")
-        print(f"{'='*60}\n")
+        logger.info("Ενημέρωση δεδομένων...")
 
         self.hospitals = self.fetch_hospital_data()
+        # Keep the list sorted by specialty so display can group in one pass
+        self.hospitals.sort(key=operator.attrgetter('specialty'))
         self.last_update = datetime.datetime.now()
 
-        print(f"✓ Δεδομένα ενημερώθηκαν επιτυχώς!")
-        print(f"  Βρέθηκαν {len(self.hospitals)} νοσοκομεία εφημερίας\n")
+        logger.info("Δεδομένα ενημερώθηκαν επιτυχώς - βρέθηκαν %d νοσοκομεία εφημερίας",
+                    len(self.hospitals))
 
     def display_hospitals(self):
         """Display all on-duty hospitals grouped by specialty"""
@@ -221,90 +350,120 @@ class AthensHospitalService:
             print("Δεν υπάρχουν διαθέσιμα δεδομένα")
             return
 
-        print(f"\n{'='*70}")
-        print(f"  ΝΟΣΟΚΟΜΕΙΑ ΕΦΗΜΕΡΙΑΣ ΑΘΗΝΩΝ")
-        print(f"  {datetime.date.today().strftime('%A, %d %B %Y')}")
+        # Build the whole table in memory and flush it with a single write
+        # instead of one syscall per print
+        buf = io.StringIO()
+        buf.write(f"\n{_DISPLAY_RULE}\n")
+        buf.write("  ΝΟΣΟΚΟΜΕΙΑ ΕΦΗΜΕΡΙΑΣ ΑΘΗΝΩΝ\n")
+        buf.write(f"  {datetime.date.today().strftime('%A, %d %B %Y')}\n")
         if self.last_update:
-            print(f"  Τελευταία ενημέρωση: {self.last_update.strftime('%H:%M:%S')}")
-        print(f"{'='*70}\n")
-
-        # Group hospitals by specialty
-        by_specialty: Dict[str, List[Hospital]] = {}
-        for hospital in self.hospitals:
-            if hospital.specialty not in by_specialty:
-                by_specialty[hospital.specialty] = []
-            by_specialty[hospital.specialty].append(hospital)
-
-        # Display grouped hospitals
-        for specialty, hospitals in sorted(by_specialty.items()):
-            print(f"\n┌─ {specialty} {'─' * (65 - len(specialty))}")
+            buf.write(f"  Τελευταία ενημέρωση: {self.last_update.strftime('%H:%M:%S')}\n")
+        buf.write(f"{_DISPLAY_RULE}\n\n")
+
+        # Display hospitals grouped by specialty (list is pre-sorted in update_data)
+        grouped = itertools.groupby(self.hospitals, key=operator.attrgetter('specialty'))
+        for specialty, group in grouped:
+            hospitals = list(group)
+            buf.write(f"\n┌─ {specialty} {'─' * max(1, 65 - len(specialty))}\n")
             for i, hospital in enumerate(hospitals, 1):
-                print(f"│")
-                print(f"│  {i}. {hospital.name}")
+                buf.write("│\n")
+                buf.write(f"│  {i}. {hospital.name}\n")
                 if hospital.time_slot:
-                    print(f"│     🕐 Ωράριο: {hospital.time_slot}")
+                    buf.write(f"│     🕐 Ωράριο: {hospital.time_slot}\n")
                 if hospital.address:
-                    print(f"│     📍 {hospital.address}")
+                    buf.write(f"│     📍 {hospital.address}\n")
                 if hospital.phone:
-                    print(f"│     📞 {hospital.phone}")
+                    buf.write(f"│     📞 {hospital.phone}\n")
                 if hospital.area:
-                    print(f"│     🏘️  {hospital.area}")
-            print(f"└{'─' * 68}")
+                    buf.write(f"│     🏘️  {hospital.area}\n")
+            buf.write(f"└{_CARD_RULE}\n")
 
-        print(f"\n{'='*70}\n")
+        buf.write(f"\n{_DISPLAY_RULE}\n\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
 
     def search_by_specialty(self, specialty_keyword: str) -> List[Hospital]:
         """Search hospitals by specialty keyword"""
         return [
             h for h in self.hospitals
-            if specialty_keyword.lower() in h.specialty.lower()
+            if specialty_keyword.lower() in h.specialty_lc
         ]
 
     def search_by_area(self, area_keyword: str) -> List[Hospital]:
         """Search hospitals by area"""
         return [
             h for h in self.hospitals
-            if area_keyword.lower() in h.area.lower()
+            if area_keyword.lower() in h.area_lc
         ]
 
     def save_to_json(self, filename: str = "hospitals_on_duty.json"):
         """Save current hospital data to JSON file"""
         data = {
             'last_update': self.last_update.isoformat() if self.last_update else None,
-            'hospitals': [asdict(h) for h in self.hospitals]
+            'hospitals': [_hospital_to_dict(h) for h in self.hospitals]
         }
 
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        # Write to a temp file and rename so readers never see a partial file
+        # (os.replace is atomic on both POSIX and Windows)
+        tmp = filename + '.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, filename)
+
+        logger.info("Δεδομένα αποθηκεύτηκαν στο %s", filename)
+
+    def save_to_jsonl(self, filename: str = "hospitals_on_duty.jsonl"):
+        """Save hospital data as JSON Lines (one hospital per line)
+
+        Lets downstream tools stream-filter with grep/jq without parsing
+        the whole document.
+        """
+        tmp = filename + '.tmp'
+        with open(tmp, 'wb') as f:
+            for h in self.hospitals:
+                f.write(orjson.dumps(_hospital_to_dict(h)))
+                f.write(b'\n')
+        os.replace(tmp, filename)
+
+        logger.info("Δεδομένα αποθηκεύτηκαν στο %s", filename)
+
 
-        print(f"✓ Δεδομένα αποθηκεύτηκαν στο {filename}")
+def _seconds_until(hour: int = 8, minute: int = 0) -> float:
+    """Seconds from now until the next occurrence of the given wall-clock time"""
+    now = datetime.datetime.now()
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += datetime.timedelta(days=1)
+    return (target - now).total_seconds()
 
 
 def main():
     """Main function to run the hospital display service"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
     service = AthensHospitalService()
 
     # Initial data fetch and display
     service.update_data()
     service.display_hospitals()
 
-    # Save to JSON file
+    # Save to JSON / JSONL files
     service.save_to_json()
-
-    # Schedule daily update at 08:00
-    schedule.every().day.at("08:00").do(service.update_data)
-    schedule.every().day.at("08:00").do(service.display_hospitals)
-    schedule.every().day.at("08:00").do(service.save_to_json)
+    service.save_to_jsonl()
 
     print("\n🕐 Υπηρεσία ξεκίνησε - θα ενημερώνεται καθημερινά στις 08:00")
     print("   Πατήστε Ctrl+C για έξοδο\n")
 
-    # Keep the program running and check schedule
+    # Sleep straight through to the next 08:00 instead of polling every minute
     try:
         while True:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+            time.sleep(_seconds_until(8, 0))
+            service.update_data()
+            service.display_hospitals()
+            service.save_to_json()
+            service.save_to_jsonl()
     except KeyboardInterrupt:
+        service.close()
         print("\n\n✓ Η υπηρεσία τερματίστηκε")
 
 
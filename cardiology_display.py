@@ -9,27 +9,101 @@ import tkinter as tk
 from tkinter import font as tkfont
 from tkinter import ttk, filedialog, messagebox, simpledialog
 from tkinter.simpledialog import Dialog
-from tkcalendar import Calendar
-from PIL import Image, ImageTk
 from datetime import datetime, date, timedelta
+import functools
+import itertools
 import json
+import logging
 import os
+import threading
+import time
 import unicodedata
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Optional
-from moh_scraper import MOHHospitalScraper, Hospital
+from moh_scraper import MOHHospitalScraper, Hospital, hospital_to_dict
 from shift_parser import ShiftParser, DailyShift
 
+# Status output goes through logging - disabled levels cost one integer
+# compare instead of an f-string build and a stdout flush under Tk
+logger = logging.getLogger(__name__)
+
+# orjson parses in C, roughly 2-5x faster than the stdlib; fall back to
+# json so the display still starts without it
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Combining diacritical marks stripped via str.translate, which runs in C
+# instead of a per-character Python loop. Besides U+0300-U+036F (everything
+# NFD of Greek text produces) the table covers the extended/supplement
+# combining blocks, so any Mn mark that can realistically appear is handled.
+# Building it is a few hundred dict entries - too cheap to be worth caching.
+_COMBINING_TBL = dict.fromkeys(itertools.chain(
+    range(0x0300, 0x0370),  # Combining Diacritical Marks
+    range(0x1AB0, 0x1B00),  # Combining Diacritical Marks Extended
+    range(0x1DC0, 0x1E00),  # Combining Diacritical Marks Supplement
+    range(0x20D0, 0x2100),  # Combining Diacritical Marks for Symbols
+))
+
+
+
+# Greek calendar names, indexed by date.weekday() / month - 1
+_GREEK_DAYS = (
+    "Δευτέρα", "Τρίτη", "Τετάρτη", "Πέμπτη", "Παρασκευή", "Σάββατο", "Κυριακή"
+)
+_GREEK_MONTHS_GEN = (
+    "Ιανουαρίου", "Φεβρουαρίου", "Μαρτίου", "Απριλίου", "Μαΐου", "Ιουνίου",
+    "Ιουλίου", "Αυγούστου", "Σεπτεμβρίου", "Οκτωβρίου", "Νοεμβρίου", "Δεκεμβρίου"
+)
+_GREEK_MONTHS_ACC = (
+    "Ιανουάριο", "Φεβρουάριο", "Μάρτιο", "Απρίλιο", "Μάιο", "Ιούνιο",
+    "Ιούλιο", "Αύγουστο", "Σεπτέμβριο", "Οκτώβριο", "Νοέμβριο", "Δεκέμβριο"
+)
+_GREEK_MONTHS_NOM = (
+    "Ιανουάριος", "Φεβρουάριος", "Μάρτιος", "Απρίλιος", "Μάιος", "Ιούνιος",
+    "Ιούλιος", "Αύγουστος", "Σεπτέμβριος", "Οκτώβριος", "Νοέμβριος", "Δεκέμβριος"
+)
+
+@functools.lru_cache(maxsize=512)
+def remove_accents(text: str) -> str:
+    """Remove accent marks from Greek text (cached - few distinct inputs)"""
+    # ASCII carries no Greek accents - return untouched, skipping even the
+    # normalization quick-check
+    if text.isascii():
+        return text
+    if not unicodedata.is_normalized('NFD', text):
+        # Normalize to NFD (decomposed form) where accents are separate
+        text = unicodedata.normalize('NFD', text)
+    return text.translate(_COMBINING_TBL)
+
 
 class HospitalDisplayGUI:
     """GUI application for displaying on-duty hospitals by specialty"""
 
-    @staticmethod
-    def remove_accents(text: str) -> str:
-        """Remove accent marks from Greek text"""
-        # Normalize to NFD (decomposed form) where accents are separate
-        nfd = unicodedata.normalize('NFD', text)
-        # Filter out combining characters (accents)
-        return ''.join(char for char in nfd if unicodedata.category(char) != 'Mn')
+    # Minimum seconds between full repaints - roughly a 10 fps cap, plenty
+    # for a wall display and cheap insurance against refresh bursts
+    _MIN_REDRAW_INTERVAL = 0.1
+
+    # Most recent dates kept in the per-date cache (about one month)
+    _DATE_CACHE_LIMIT = 31
+
+    # Cards packed per rendering pass - about a screenful across 3 columns
+    _RENDER_BATCH = 24
+
+    # Optional DailyShift roles shown in the shift table, in display order
+    _SHIFT_FIELDS = (
+        ("major_shift", "Μεγάλη Εφημερία (24ωρη):"),
+        ("minor_shift", "Μικρή Εφημερία (24ωρη):"),
+        ("tep_cardiologist", "Καρδιολόγος ΤΕΠ (12ωρη):"),
+        ("senior_cardiac_surgeon", "Καρδιοχειρουργός 1:"),
+        ("junior_cardiac_surgeon", "Καρδιοχειρουργός 2:"),
+        ("anesthesiologist_1", "Αναισθησιολόγος 1:"),
+        ("anesthesiologist_2", "Αναισθησιολόγος 2:"),
+        ("pediatric_cardiologist", "Παιδοκαρδιολόγος:"),
+    )
 
     def __init__(self, root):
         self.root = root
@@ -59,6 +133,36 @@ class HospitalDisplayGUI:
         self.filtered_hospitals: List[Hospital] = []
         self.selected_specialty = "Καρδιολογία"  # Default specialty
         self.available_specialties: List[str] = []
+        self._title_for_specialty: Dict[str, str] = {}
+
+        # Hospitals grouped by Greek specialty token, built once per fetch
+        self._by_specialty: Dict[str, List[Hospital]] = {}
+
+        # Per-date results from this and previous sessions - navigating back
+        # to a visited date skips the scrape entirely
+        self._by_date: "OrderedDict[date, List[Hospital]]" = OrderedDict()
+        self._date_cache_file = "hospitals_by_date.json"
+        self._load_date_cache()
+
+        # Widget pools for the hospital card area - reused across refreshes
+        self._columns: List[tk.Frame] = []
+        self._header_pools: List[List[tk.Label]] = []
+        self._card_pools: List[List[Dict]] = []
+        self._no_data_label: Optional[tk.Label] = None
+
+        # Incremental card rendering state (see _render_batch)
+        self._render_queue: List = []
+        self._render_queue_pos = 0
+        self._cards_used: List[int] = []
+        self._headers_used: List[int] = []
+        self._render_batch_id = None
+
+        # Pooled dialogs - built on first open, then hidden/reshown
+        self._cal_dialog: Optional[tk.Toplevel] = None
+        self._cal_widget = None
+        self._edit_dialog: Optional[tk.Toplevel] = None
+        self._edit_title: Optional[tk.Label] = None
+        self._edit_entries: Dict[str, tk.Entry] = {}
 
         # Shift management
         self.shift_parser: Optional[ShiftParser] = None
@@ -68,6 +172,35 @@ class HospitalDisplayGUI:
         # Date navigation
         self.selected_date = date.today()
 
+        # Pending after() ids used to coalesce rapid clicks into one refresh
+        self._refresh_after_id = None
+        self._redraw_after_id = None
+
+        # Full-redraw rate limiting - bursts of applied results are coalesced
+        # so repeated refreshes can't hog the Tk event loop
+        self._last_redraw = 0.0
+        self._render_pending = False
+
+        # Fetch generation counter - stale background fetches are discarded
+        self._current_gen = 0
+
+        # Single-worker pool for disk writes kicked off from the GUI
+        self._io_pool = ThreadPoolExecutor(max_workers=1)
+
+        # Shared Font objects - Tk font creation costs a server round-trip,
+        # so each family/size/weight combination is built once and reused
+        self._fonts = {
+            'title': tkfont.Font(family="Arial", size=24, weight="bold"),
+            'section': tkfont.Font(family="Arial", size=14, weight="bold"),
+            'large': tkfont.Font(family="Arial", size=16),
+            'label_bold': tkfont.Font(family="Arial", size=12, weight="bold"),
+            'label': tkfont.Font(family="Arial", size=12),
+            'body_bold': tkfont.Font(family="Arial", size=11, weight="bold"),
+            'body': tkfont.Font(family="Arial", size=11),
+            'small': tkfont.Font(family="Arial", size=10),
+            'detail': tkfont.Font(family="Arial", size=9),
+        }
+
         # Create UI
         self.create_ui()
 
@@ -80,6 +213,19 @@ class HospitalDisplayGUI:
         # Schedule daily refresh at 08:00
         self.schedule_daily_refresh()
 
+        # Warm the pooled dialogs once the loop goes idle after the first
+        # paint, so the first click doesn't pay the Calendar build either
+        self.root.after_idle(self._warm_dialog_pools)
+
+    def _warm_dialog_pools(self):
+        """Pre-build the calendar and edit dialogs in idle time, withdrawn"""
+        try:
+            self._get_calendar_dialog().withdraw()
+            self._get_edit_dialog().withdraw()
+        except Exception as e:
+            # e.g. tkcalendar missing - the dialogs fall back to lazy build
+            logger.warning("Αδυναμία προετοιμασίας διαλόγων: %s", e)
+
     def create_ui(self):
         """Create the user interface"""
 
@@ -89,27 +235,10 @@ class HospitalDisplayGUI:
         header_frame.pack_propagate(False)
 
         # Load and display logo in upper left corner
-        try:
-            logo_path = os.path.join(os.path.dirname(__file__), "onasseio_logo.png")
-            logo_image = Image.open(logo_path)
-            # Resize logo to fit in header (max height 70px to leave margin)
-            logo_height = 70
-            aspect_ratio = logo_image.width / logo_image.height
-            logo_width = int(logo_height * aspect_ratio)
-            logo_image = logo_image.resize((logo_width, logo_height), Image.LANCZOS)
-            self.logo_photo = ImageTk.PhotoImage(logo_image)
-
-            logo_label = tk.Label(
-                header_frame,
-                image=self.logo_photo,
-                bg=self.header_color
-            )
-            logo_label.pack(side=tk.LEFT, padx=10, pady=5)
-        except Exception as e:
-            print(f"⚠ Αδυναμία φόρτωσης λογότυπου: {e}")
+        self._load_logo(header_frame)
 
         # Title
-        title_font = tkfont.Font(family="Arial", size=24, weight="bold")
+        title_font = self._fonts['title']
         self.title_label = tk.Label(
             header_frame,
             text="ΝΟΣΟΚΟΜΕΙΑ ΕΦΗΜΕΡΙΑΣ - ΚΑΡΔΙΟΛΟΓΙΑ",
@@ -135,7 +264,7 @@ class HospitalDisplayGUI:
             command=self.previous_day,
             bg=self.highlight_color,
             fg="white",
-            font=tkfont.Font(family="Arial", size=10),
+            font=self._fonts['small'],
             relief=tk.FLAT,
             padx=10,
             pady=5
@@ -149,7 +278,7 @@ class HospitalDisplayGUI:
             command=self.open_calendar,
             bg=self.secondary_blue,
             fg="white",
-            font=tkfont.Font(family="Arial", size=10),
+            font=self._fonts['small'],
             relief=tk.FLAT,
             padx=10,
             pady=5
@@ -163,7 +292,7 @@ class HospitalDisplayGUI:
             command=self.next_day,
             bg=self.highlight_color,
             fg="white",
-            font=tkfont.Font(family="Arial", size=10),
+            font=self._fonts['small'],
             relief=tk.FLAT,
             padx=10,
             pady=5
@@ -171,7 +300,7 @@ class HospitalDisplayGUI:
         next_btn.pack(side=tk.LEFT, padx=2)
 
         # Selected date display
-        datetime_font = tkfont.Font(family="Arial", size=12, weight="bold")
+        datetime_font = self._fonts['label_bold']
         self.datetime_label = tk.Label(
             date_nav_frame,
             font=datetime_font,
@@ -187,7 +316,7 @@ class HospitalDisplayGUI:
         selector_label = tk.Label(
             selector_frame,
             text="Ειδικότητα:",
-            font=tkfont.Font(family="Arial", size=12),
+            font=self._fonts['label'],
             bg=self.bg_color,
             fg=self.text_color
         )
@@ -208,7 +337,7 @@ class HospitalDisplayGUI:
         self.specialty_combo = ttk.Combobox(
             selector_frame,
             textvariable=self.specialty_var,
-            font=tkfont.Font(family="Arial", size=12),
+            font=self._fonts['label'],
             width=30,
             state='readonly',
             style='Custom.TCombobox'
@@ -222,7 +351,7 @@ class HospitalDisplayGUI:
 
         self.update_label = tk.Label(
             update_frame,
-            font=tkfont.Font(family="Arial", size=10),
+            font=self._fonts['small'],
             bg=self.bg_color,
             fg="#6C757D"  # Medium gray for subtle text
         )
@@ -242,51 +371,89 @@ class HospitalDisplayGUI:
             lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
         )
 
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self._scroll_window_id = self.canvas.create_window(
+            (0, 0), window=self.scrollable_frame, anchor="nw"
+        )
         self.canvas.configure(yscrollcommand=scrollbar.set)
 
         self.canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
 
-        # Enable mouse wheel scrolling
-        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
-        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
+        # Enable mouse wheel scrolling - the global binding is only active
+        # while the pointer is over the canvas, so wheel events elsewhere in
+        # the window don't invoke the Python handler at all
+        self.canvas.bind("<Enter>", self._bind_mousewheel)
+        self.canvas.bind("<Leave>", self._unbind_mousewheel)
 
         # Shift display section at bottom
         self.create_shift_section()
 
 
+    def _load_logo(self, header_frame):
+        """Load and place the hospital logo (PIL imported lazily)
+
+        The resized logo is cached on disk in a native Tk format so later
+        startups skip the PNG decode and LANCZOS resample entirely.
+        """
+        try:
+            logo_height = 70  # Max height to leave margin in the header
+            base_dir = os.path.dirname(__file__)
+            logo_path = os.path.join(base_dir, "onasseio_logo.png")
+            cache_path = os.path.join(base_dir, f"onasseio_logo_h{logo_height}.ppm")
+
+            if os.path.exists(cache_path):
+                # PPM is a native Tk format - no PIL needed at all
+                self.logo_photo = tk.PhotoImage(file=cache_path)
+            else:
+                # PIL is only needed here - importing it lazily shortens startup
+                from PIL import Image, ImageTk
+
+                logo_image = Image.open(logo_path)
+                # Resize logo to fit in header
+                aspect_ratio = logo_image.width / logo_image.height
+                logo_width = int(logo_height * aspect_ratio)
+                logo_image = logo_image.resize((logo_width, logo_height), Image.LANCZOS)
+                self.logo_photo = ImageTk.PhotoImage(logo_image)
+
+                # Best effort - a read-only install directory just means
+                # the next startup decodes the PNG again
+                try:
+                    logo_image.convert('RGB').save(cache_path)
+                except OSError as e:
+                    logger.debug("Αδυναμία αποθήκευσης cache λογότυπου: %s", e)
+
+            logo_label = tk.Label(
+                header_frame,
+                image=self.logo_photo,
+                bg=self.header_color
+            )
+            logo_label.pack(side=tk.LEFT, padx=10, pady=5)
+        except Exception as e:
+            logger.warning("Αδυναμία φόρτωσης λογότυπου: %s", e)
+
+    def _bind_mousewheel(self, event=None):
+        """Activate wheel scrolling while the pointer is over the canvas"""
+        self.canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-4>", self._on_mousewheel)
+        self.canvas.bind_all("<Button-5>", self._on_mousewheel)
+
+    def _unbind_mousewheel(self, event=None):
+        """Drop the global wheel bindings when the pointer leaves"""
+        self.canvas.unbind_all("<MouseWheel>")
+        self.canvas.unbind_all("<Button-4>")
+        self.canvas.unbind_all("<Button-5>")
+
     def _on_mousewheel(self, event):
         """Handle mouse wheel scrolling"""
         if event.num == 5 or event.delta == -120:
             self.canvas.yview_scroll(1, "units")
-        if event.num == 4 or event.delta == 120:
+        elif event.num == 4 or event.delta == 120:
             self.canvas.yview_scroll(-1, "units")
 
     def update_datetime(self):
         """Update date display to show selected date"""
-        # Greek day names
-        greek_days = {
-            0: "Δευτέρα",
-            1: "Τρίτη",
-            2: "Τετάρτη",
-            3: "Πέμπτη",
-            4: "Παρασκευή",
-            5: "Σάββατο",
-            6: "Κυριακή"
-        }
-
-        # Greek month names
-        greek_months = {
-            1: "Ιανουαρίου", 2: "Φεβρουαρίου", 3: "Μαρτίου",
-            4: "Απριλίου", 5: "Μαΐου", 6: "Ιουνίου",
-            7: "Ιουλίου", 8: "Αυγούστου", 9: "Σεπτεμβρίου",
-            10: "Οκτωβρίου", 11: "Νοεμβρίου", 12: "Δεκεμβρίου"
-        }
-
-        day_name = greek_days[self.selected_date.weekday()]
-        month_name = greek_months[self.selected_date.month]
+        day_name = _GREEK_DAYS[self.selected_date.weekday()]
+        month_name = _GREEK_MONTHS_GEN[self.selected_date.month - 1]
 
         # Show if selected date is today
         today = date.today()
@@ -297,19 +464,66 @@ class HospitalDisplayGUI:
 
         self.datetime_label.config(text=date_str)
 
-    def refresh_data(self):
-        """Fetch and display fresh hospital data for the selected date"""
-        print(f"\n{'='*60}")
-        print(f"Ανανέωση δεδομένων νοσοκομείων...")
-        print(f"Ημερομηνία: {self.selected_date.strftime('%Y-%m-%d')}")
-        print(f"Ώρα: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*60}\n")
+    def refresh_data(self, force: bool = False):
+        """Fetch and display fresh hospital data for the selected date
+
+        With force=True the per-date cache is bypassed and the scraper is
+        always consulted, so the daily refresh can replace a stale snapshot.
+        """
+        # Already-visited dates are served from the per-date cache, so
+        # previous/next-day navigation doesn't re-hit the scraper
+        cached = None if force else self._by_date.get(self.selected_date)
+        if cached is not None:
+            self._by_date.move_to_end(self.selected_date)
+            logger.info("Δεδομένα για %s από την προσωρινή μνήμη", self.selected_date.isoformat())
+            self.all_hospitals = cached
+            self.extract_specialties()
+            self.filter_by_specialty()
+            self._render_all()
+            return
+
+        logger.info("Ανανέωση δεδομένων νοσοκομείων για %s", self.selected_date.isoformat())
 
+        # Fetch off the Tk thread so the window stays responsive; results are
+        # marshalled back to the GUI thread via after()
+        self._current_gen += 1
+        threading.Thread(
+            target=self._fetch_worker,
+            args=(self.selected_date, self._current_gen),
+            daemon=True
+        ).start()
+
+        # The date header doesn't depend on the fetch - update it right away
+        self.update_datetime()
+
+    def _fetch_worker(self, target_date: date, gen: int):
+        """Worker thread: run the scraper and hand results to the GUI thread"""
         try:
-            # Fetch schedule for selected date
-            self.all_hospitals = self.scraper.get_schedule_for_date(self.selected_date)
+            hospitals = self.scraper.get_schedule_for_date(target_date)
+            error = None
+        except Exception as e:
+            hospitals = None
+            error = e
+        self.root.after(0, self._apply_results, gen, target_date, hospitals, error)
+
+    def _apply_results(self, gen: int, target_date: date,
+                       hospitals: Optional[List[Hospital]], error):
+        """GUI thread: apply fetched data unless a newer fetch superseded it"""
+        if gen != self._current_gen:
+            return
 
-            print(f"✓ Βρέθηκαν {len(self.all_hospitals)} νοσοκομεία εφημερίας")
+        if error is not None:
+            logger.error("Σφάλμα λήψης δεδομένων: %s", error)
+            # Try to load from cached JSON
+            self.load_from_cache()
+        else:
+            self.all_hospitals = hospitals
+            # An empty fetch usually means the schedule isn't published
+            # yet - caching it would pin the date to a blank display
+            if hospitals:
+                self._cache_for_date(target_date, hospitals)
+
+            logger.info("Βρέθηκαν %d νοσοκομεία εφημερίας", len(self.all_hospitals))
 
             # Extract unique specialties
             self.extract_specialties()
@@ -317,12 +531,21 @@ class HospitalDisplayGUI:
             # Filter for selected specialty
             self.filter_by_specialty()
 
-        except Exception as e:
-            print(f"✗ Σφάλμα λήψης δεδομένων: {e}")
-            # Try to load from cached JSON
-            self.load_from_cache()
+        self._render_all()
 
-        # Update display
+    def _render_all(self):
+        """Repaint everything, at most once per _MIN_REDRAW_INTERVAL
+
+        Calls landing inside the interval set a pending flag and are
+        coalesced into a single deferred repaint.
+        """
+        if time.monotonic() - self._last_redraw < self._MIN_REDRAW_INTERVAL:
+            if not self._render_pending:
+                self._render_pending = True
+                self.root.after(50, self._deferred_render)
+            return
+
+        self._last_redraw = time.monotonic()
         self.display_hospitals()
         self.update_datetime()
         self.update_shift_display()
@@ -332,19 +555,36 @@ class HospitalDisplayGUI:
             text=f"Τελευταία ενημέρωση: {datetime.now().strftime('%H:%M')}"
         )
 
-    def extract_specialties(self):
-        """Extract unique specialties from hospital data and populate dropdown"""
-        specialty_set = set()
+    def _deferred_render(self):
+        """Run a repaint that was postponed by the rate limiter"""
+        self._render_pending = False
+        self._render_all()
+
+    def _index_hospitals(self):
+        """Group hospitals by their Greek specialty token in a single pass"""
+        by_specialty: Dict[str, List[Hospital]] = defaultdict(list)
         for hospital in self.all_hospitals:
             # Extract only Greek part of specialty (before " / ")
-            specialty_greek = hospital.specialty.split(" / ")[0].strip()
-            specialty_set.add(specialty_greek)
+            specialty_greek = hospital.specialty.split(" / ", 1)[0].strip()
+            by_specialty[specialty_greek].append(hospital)
+        self._by_specialty = by_specialty
 
-        self.available_specialties = sorted(list(specialty_set))
+    def extract_specialties(self):
+        """Extract unique specialties from hospital data and populate dropdown"""
+        self._index_hospitals()
+        self.available_specialties = sorted(self._by_specialty.keys())
 
         # Add "Όλες οι ειδικότητες" option at the beginning
         self.available_specialties.insert(0, "Όλες οι ειδικότητες")
 
+        # Precompute the full title string per specialty so changing the
+        # selection is a single dict lookup
+        self._title_for_specialty = {
+            s: f"ΝΟΣΟΚΟΜΕΙΑ ΕΦΗΜΕΡΙΑΣ - {remove_accents(s.upper())}"
+            for s in self.available_specialties
+        }
+        self._title_for_specialty["Όλες οι ειδικότητες"] = "ΝΟΣΟΚΟΜΕΙΑ ΕΦΗΜΕΡΙΑΣ"
+
         # Update combobox values
         self.specialty_combo['values'] = self.available_specialties
 
@@ -363,204 +603,300 @@ class HospitalDisplayGUI:
         if self.selected_specialty == "Όλες οι ειδικότητες":
             self.filtered_hospitals = self.all_hospitals
         else:
-            # Filter by matching Greek specialty name (which is at the beginning of the specialty string)
-            self.filtered_hospitals = [
-                h for h in self.all_hospitals
-                if h.specialty.startswith(self.selected_specialty)
-            ]
+            # O(1) lookup in the specialty index built at ingest time
+            self.filtered_hospitals = self._by_specialty.get(
+                self.selected_specialty, []
+            )
 
-        print(f"  Φιλτράρισμα για: {self.selected_specialty}")
-        print(f"  Βρέθηκαν {len(self.filtered_hospitals)} νοσοκομεία")
+        logger.debug("Φιλτράρισμα για %s: %d νοσοκομεία",
+                     self.selected_specialty, len(self.filtered_hospitals))
 
-        # Update title
-        if self.selected_specialty == "Όλες οι ειδικότητες":
-            title_text = "ΝΟΣΟΚΟΜΕΙΑ ΕΦΗΜΕΡΙΑΣ"
-        else:
-            specialty_upper = self.remove_accents(self.selected_specialty.upper())
-            title_text = f"ΝΟΣΟΚΟΜΕΙΑ ΕΦΗΜΕΡΙΑΣ - {specialty_upper}"
-        self.title_label.config(text=title_text)
+        # Update title from the cache built in extract_specialties
+        self.title_label.config(text=self._title_for_specialty.get(
+            self.selected_specialty,
+            f"ΝΟΣΟΚΟΜΕΙΑ ΕΦΗΜΕΡΙΑΣ - {remove_accents(self.selected_specialty.upper())}"
+        ))
 
     def on_specialty_changed(self, event):
         """Handle specialty selection change"""
         self.selected_specialty = self.specialty_var.get()
-        print(f"\nΑλλαγή ειδικότητας σε: {self.selected_specialty}")
+        logger.debug("Αλλαγή ειδικότητας σε: %s", self.selected_specialty)
+        # Debounce so rapid combobox changes repaint once
+        if self._redraw_after_id is not None:
+            self.root.after_cancel(self._redraw_after_id)
+        self._redraw_after_id = self.root.after(120, self._do_redraw)
+
+    def _do_redraw(self):
+        """Apply the pending filter change and repaint"""
+        self._redraw_after_id = None
         self.filter_by_specialty()
         self.display_hospitals()
 
+    def _schedule_refresh(self, delay_ms: int = 120):
+        """Coalesce rapid navigation clicks into a single data refresh"""
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.root.after(delay_ms, self._do_refresh)
+
+    def _do_refresh(self):
+        """Run the refresh scheduled by _schedule_refresh"""
+        self._refresh_after_id = None
+        self.refresh_data()
+
+    def _cache_for_date(self, target_date: date, hospitals: List[Hospital]):
+        """Remember a fetched schedule and persist the per-date cache"""
+        self._by_date[target_date] = hospitals
+        self._by_date.move_to_end(target_date)
+        while len(self._by_date) > self._DATE_CACHE_LIMIT:
+            self._by_date.popitem(last=False)
+        self._save_date_cache()
+
+    def _load_date_cache(self):
+        """Restore the per-date cache persisted by a previous session"""
+        if not os.path.exists(self._date_cache_file):
+            return
+        try:
+            with open(self._date_cache_file, 'rb') as f:
+                data = _json_loads(f.read())
+            self._by_date = OrderedDict(
+                (date.fromisoformat(d), [Hospital(**h) for h in entries])
+                for d, entries in data.items()
+            )
+        except Exception as e:
+            logger.warning("Αδυναμία φόρτωσης κρυφής μνήμης ημερομηνιών: %s", e)
+            self._by_date = OrderedDict()
+
+    def _save_date_cache(self):
+        """Write the per-date cache atomically (tmp file + rename)"""
+        data = {
+            d.isoformat(): [hospital_to_dict(h) for h in hospitals]
+            for d, hospitals in self._by_date.items()
+        }
+        tmp = self._date_cache_file + '.tmp'
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self._date_cache_file)
+        except Exception as e:
+            logger.warning("Αδυναμία αποθήκευσης κρυφής μνήμης ημερομηνιών: %s", e)
+
     def load_from_cache(self):
         """Load hospital data from cached JSON file"""
         cache_file = "hospitals_on_duty.json"
         if os.path.exists(cache_file):
             try:
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    hospitals_data = data.get('hospitals', [])
-
-                    # Convert to Hospital objects
-                    from dataclasses import dataclass
-                    self.all_hospitals = []
-                    for h_data in hospitals_data:
-                        self.all_hospitals.append(Hospital(
-                            name=h_data.get('name', ''),
-                            specialty=h_data.get('specialty', ''),
-                            time_slot=h_data.get('time_slot', ''),
-                            on_duty_date=h_data.get('on_duty_date', ''),
-                            address=h_data.get('address', ''),
-                            phone=h_data.get('phone', ''),
-                            area=h_data.get('area', '')
-                        ))
-
-                    print(f"✓ Φορτώθηκαν {len(self.all_hospitals)} νοσοκομεία από την προσωρινή μνήμη")
-
-                    # Extract specialties and filter
-                    self.extract_specialties()
-                    self.filter_by_specialty()
+                with open(cache_file, 'rb') as f:
+                    data = _json_loads(f.read())
+                hospitals_data = data.get('hospitals', [])
+
+                # The cache is written from Hospital fields, so the keys map
+                # straight onto the constructor - no per-field .get() lookups
+                self.all_hospitals = [Hospital(**h) for h in hospitals_data]
+
+                logger.info("Φορτώθηκαν %d νοσοκομεία από την προσωρινή μνήμη", len(self.all_hospitals))
+
+                # Extract specialties and filter
+                self.extract_specialties()
+                self.filter_by_specialty()
 
             except Exception as e:
-                print(f"✗ Σφάλμα φόρτωσης προσωρινής μνήμης: {e}")
+                logger.error("Σφάλμα φόρτωσης προσωρινής μνήμης: %s", e)
                 self.all_hospitals = []
                 self.filtered_hospitals = []
 
     def display_hospitals(self):
         """Display hospital cards in the GUI - all time slots in one screen"""
+        # Drop any card batches still queued from the previous render
+        if self._render_batch_id is not None:
+            self.root.after_cancel(self._render_batch_id)
+            self._render_batch_id = None
+
+        # Unmap the card area while it is being rebuilt so Tk does one
+        # layout/redraw pass when it reappears instead of one per pack call
+        self.canvas.itemconfigure(self._scroll_window_id, state='hidden')
+
         # Clear existing content
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        # Hide the previous render - widgets are pooled and reconfigured
+        # instead of destroyed, since Tk widget churn dominates re-render cost
+        if self._no_data_label is not None:
+            self._no_data_label.pack_forget()
+        for col_frame, headers, cards in zip(
+                self._columns, self._header_pools, self._card_pools):
+            col_frame.pack_forget()
+            for label in headers:
+                label.pack_forget()
+            for card in cards:
+                card['frame'].pack_forget()
 
         if not self.filtered_hospitals:
             # No data available
-            no_data_label = tk.Label(
-                self.scrollable_frame,
-                text="Δεν υπάρχουν διαθέσιμα δεδομένα",
-                font=tkfont.Font(family="Arial", size=16),
-                bg=self.bg_color,
-                fg="#ADB5BD",  # Light gray for no-data state
-                pady=50
-            )
-            no_data_label.pack(fill=tk.BOTH, expand=True)
+            if self._no_data_label is None:
+                self._no_data_label = tk.Label(
+                    self.scrollable_frame,
+                    text="Δεν υπάρχουν διαθέσιμα δεδομένα",
+                    font=self._fonts['large'],
+                    bg=self.bg_color,
+                    fg="#ADB5BD",  # Light gray for no-data state
+                    pady=50
+                )
+            self._no_data_label.pack(fill=tk.BOTH, expand=True)
+            self._show_scroll_window()
             return
 
-        # Group by time slot
-        by_time_slot: Dict[str, List[Hospital]] = {}
-        for hospital in self.filtered_hospitals:
-            time_slot = hospital.time_slot or "Όλη την ημέρα"
-            if time_slot not in by_time_slot:
-                by_time_slot[time_slot] = []
-            by_time_slot[time_slot].append(hospital)
-
-        # Create grid layout to show all time slots side by side
-        sorted_slots = sorted(by_time_slot.items())
+        # Group by time slot - one sort plus a groupby walk instead of a
+        # dict of lists followed by a second sort over the items
+        slot_key = lambda h: h.time_slot or "Όλη την ημέρα"
+        sorted_slots = [
+            (time_slot, list(group))
+            for time_slot, group in itertools.groupby(
+                sorted(self.filtered_hospitals, key=slot_key), key=slot_key
+            )
+        ]
         num_columns = min(len(sorted_slots), 3)  # Max 3 columns for readability
 
-        # Create column frames
-        columns = []
+        # Show the column frames in use
         for col_idx in range(num_columns):
-            col_frame = tk.Frame(self.scrollable_frame, bg=self.bg_color)
-            col_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5)
-            columns.append(col_frame)
+            self._get_column(col_idx).pack(
+                side=tk.LEFT, fill=tk.BOTH, expand=True, padx=5
+            )
 
-        # Distribute time slots across columns
+        # Queue headers and cards together, in pack order - roughly a
+        # screenful is rendered synchronously, the remainder in idle-time
+        # batches so large lists ("Όλες") don't block the first paint.
+        # Headers must go through the same queue as their cards: pack order
+        # is call order, so packing headers up front would detach a second
+        # slot's heading from its hospitals in columns holding two slots
+        self._headers_used = [0] * num_columns
+        self._cards_used = [0] * num_columns
+        self._render_queue = []
         for i, (time_slot, hospitals) in enumerate(sorted_slots):
             col_idx = i % num_columns
-            column = columns[col_idx]
-
-            # Time slot header
-            slot_header = tk.Frame(column, bg=self.bg_color)
-            slot_header.pack(fill=tk.X, pady=(10 if i >= num_columns else 0, 5))
-
-            time_slot_label = tk.Label(
-                slot_header,
-                text=f"🕐 {time_slot}",
-                font=tkfont.Font(family="Arial", size=14, weight="bold"),
+            pad_top = 10 if i >= num_columns else 0
+            self._render_queue.append(('header', col_idx, f"🕐 {time_slot}", pad_top))
+            for hospital in hospitals:
+                self._render_queue.append(('card', col_idx, hospital, 0))
+
+        self._render_queue_pos = 0
+        self._render_batch()
+
+    def _render_batch(self):
+        """Pack the next batch of queued items, deferring the rest to idle"""
+        self._render_batch_id = None
+        queue = self._render_queue
+        end = min(len(queue), self._render_queue_pos + self._RENDER_BATCH)
+        for kind, col_idx, payload, pad_top in queue[self._render_queue_pos:end]:
+            if kind == 'header':
+                header = self._acquire_slot_header(col_idx, self._headers_used[col_idx])
+                self._headers_used[col_idx] += 1
+                header.config(text=payload)
+                header.pack(fill=tk.X, padx=5, pady=(pad_top, 5))
+            else:
+                card = self._acquire_card(col_idx, self._cards_used[col_idx])
+                self._cards_used[col_idx] += 1
+                self._configure_card(card, payload)
+                card['frame'].pack(fill=tk.X, padx=5, pady=3)
+        self._render_queue_pos = end
+        # Remap after the batch - the first call makes the initial screenful
+        # visible in one layout pass, later calls are no-ops on the state
+        self._show_scroll_window()
+        if end < len(queue):
+            self._render_batch_id = self.root.after_idle(self._render_batch)
+
+    def _show_scroll_window(self):
+        """Remap the card area and recompute the scroll region once"""
+        self.canvas.itemconfigure(self._scroll_window_id, state='normal')
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+
+    def _get_column(self, col_idx: int) -> tk.Frame:
+        """Get (or lazily create) the persistent column frame at an index"""
+        while len(self._columns) <= col_idx:
+            self._columns.append(tk.Frame(self.scrollable_frame, bg=self.bg_color))
+            self._header_pools.append([])
+            self._card_pools.append([])
+        return self._columns[col_idx]
+
+    def _acquire_slot_header(self, col_idx: int, idx: int) -> tk.Label:
+        """Get a pooled time-slot header label, creating one if needed"""
+        pool = self._header_pools[col_idx]
+        if idx >= len(pool):
+            pool.append(tk.Label(
+                self._columns[col_idx],
+                font=self._fonts['section'],
                 bg=self.bg_color,
                 fg=self.highlight_color,
                 anchor="w"
-            )
-            time_slot_label.pack(fill=tk.X, padx=5)
-
-            # Hospital cards
-            for hospital in hospitals:
-                self.create_hospital_card(hospital, column)
-
-    def create_hospital_card(self, hospital: Hospital, parent=None):
-        """Create a card widget for a hospital"""
-        if parent is None:
-            parent = self.scrollable_frame
-
-        # Card frame with Onassis-style border
+            ))
+        return pool[idx]
+
+    def _acquire_card(self, col_idx: int, idx: int) -> Dict:
+        """Get a pooled hospital card, creating its widgets if needed"""
+        pool = self._card_pools[col_idx]
+        if idx >= len(pool):
+            pool.append(self._build_card(self._columns[col_idx]))
+        return pool[idx]
+
+    def _build_card(self, parent) -> Dict:
+        """Build the widget set for one hospital card
+
+        A single flat frame per card - the Onassis-blue border comes from
+        highlightbackground instead of nested wrapper frames, so each card
+        costs one frame and four labels instead of three frames and four
+        labels with their extra geometry passes.
+        """
         card = tk.Frame(
             parent,
-            bg=self.highlight_color,  # Blue border
-            relief=tk.FLAT,
-            borderwidth=0
-        )
-        card.pack(fill=tk.X, padx=5, pady=3)
-
-        # Inner card with padding for border effect
-        inner_card = tk.Frame(
-            card,
-            bg=self.card_color
+            bg=self.card_color,
+            highlightbackground=self.highlight_color,  # Blue border
+            highlightthickness=1,
+            bd=0
         )
-        inner_card.pack(fill=tk.BOTH, padx=1, pady=1)
-
-        # Inner padding frame
-        inner = tk.Frame(inner_card, bg=self.card_color)
-        inner.pack(fill=tk.BOTH, padx=8, pady=8)
 
         # Hospital name
         name_label = tk.Label(
-            inner,
-            text=hospital.name,
-            font=tkfont.Font(family="Arial", size=11, weight="bold"),
+            card,
+            font=self._fonts['body_bold'],
             bg=self.card_color,
             fg=self.text_color,
             anchor="w",
             wraplength=400,
             justify=tk.LEFT
         )
-        name_label.pack(fill=tk.X, pady=(0, 5))
-
-        # Info frame for details
-        info_frame = tk.Frame(inner, bg=self.card_color)
-        info_frame.pack(fill=tk.X)
+        name_label.pack(fill=tk.X, padx=8, pady=(8, 5))
 
-        detail_font = tkfont.Font(family="Arial", size=9)
+        detail_font = self._fonts['detail']
 
-        # Address
-        if hospital.address:
-            addr_label = tk.Label(
-                info_frame,
-                text=f"📍 {hospital.address}",
+        detail_labels = {}
+        for key in ('address', 'phone', 'area'):
+            detail_labels[key] = tk.Label(
+                card,
                 font=detail_font,
                 bg=self.card_color,
                 fg="#495057",  # Darker gray for secondary text
                 anchor="w"
             )
-            addr_label.pack(fill=tk.X, pady=2)
 
-        # Phone
-        if hospital.phone:
-            phone_label = tk.Label(
-                info_frame,
-                text=f"📞 {hospital.phone}",
-                font=detail_font,
-                bg=self.card_color,
-                fg="#495057",  # Darker gray for secondary text
-                anchor="w"
-            )
-            phone_label.pack(fill=tk.X, pady=2)
+        return {
+            'frame': card,
+            'name_label': name_label,
+            'detail_labels': detail_labels,
+        }
 
-        # Area
-        if hospital.area:
-            area_label = tk.Label(
-                info_frame,
-                text=f"🏘️  {hospital.area}",
-                font=detail_font,
-                bg=self.card_color,
-                fg="#495057",  # Darker gray for secondary text
-                anchor="w"
-            )
-            area_label.pack(fill=tk.X, pady=2)
+    def _configure_card(self, card: Dict, hospital: Hospital):
+        """Point a pooled card's labels at a hospital's data"""
+        card['name_label'].config(text=hospital.name)
+
+        details = {
+            'address': f"📍 {hospital.address}" if hospital.address else "",
+            'phone': f"📞 {hospital.phone}" if hospital.phone else "",
+            'area': f"🏘️  {hospital.area}" if hospital.area else "",
+        }
+        for key, label in card['detail_labels'].items():
+            text = details[key]
+            if text:
+                label.config(text=text)
+                label.pack(fill=tk.X, padx=8, pady=(2, 6))
+            else:
+                label.pack_forget()
 
     def create_shift_section(self):
         """Create the shift display section at the bottom of the window"""
@@ -580,7 +916,7 @@ class HospitalDisplayGUI:
         self.shift_title = tk.Label(
             title_row,
             text="ΕΦΗΜΕΡΙΕΣ ΚΑΡΔΙΟΛΟΓΙΚΟΥ ΤΟΜΕΑ",
-            font=tkfont.Font(family="Arial", size=14, weight="bold"),
+            font=self._fonts['section'],
             bg=self.card_color,
             fg=self.highlight_color
         )
@@ -597,7 +933,7 @@ class HospitalDisplayGUI:
             command=self.load_shift_file,
             bg=self.highlight_color,
             fg="white",
-            font=tkfont.Font(family="Arial", size=10),
+            font=self._fonts['small'],
             relief=tk.FLAT,
             padx=10,
             pady=5
@@ -611,7 +947,7 @@ class HospitalDisplayGUI:
             command=self.edit_shifts,
             bg=self.secondary_blue,
             fg="white",
-            font=tkfont.Font(family="Arial", size=10),
+            font=self._fonts['small'],
             relief=tk.FLAT,
             padx=10,
             pady=5
@@ -622,6 +958,42 @@ class HospitalDisplayGUI:
         self.shift_details_frame = tk.Frame(self.shift_frame, bg=self.card_color)
         self.shift_details_frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
 
+        # Pre-built widgets for the shift table - update_shift_display only
+        # reconfigures texts and shows/hides rows, it never allocates widgets
+        self._shift_message = tk.Label(
+            self.shift_details_frame,
+            font=self._fonts['body'],
+            bg=self.card_color,
+            fg="#6C757D"
+        )
+        self._shift_grid = tk.Frame(self.shift_details_frame, bg=self.card_color)
+        self._shift_cells = []
+        grid_opts = dict(sticky="w", padx=10, pady=3)
+        for row in range(9):
+            name_label = tk.Label(
+                self._shift_grid,
+                font=self._fonts['label_bold'],
+                bg=self.card_color,
+                fg=self.text_color,
+                anchor="w"
+            )
+            value_label = tk.Label(
+                self._shift_grid,
+                font=self._fonts['label'],
+                bg=self.card_color,
+                fg=self.text_color,
+                anchor="w"
+            )
+            name_label.grid(row=row, column=0, **grid_opts)
+            value_label.grid(row=row, column=1, **grid_opts)
+            name_label.grid_remove()
+            value_label.grid_remove()
+            self._shift_cells.append((name_label, value_label))
+
+        # (caption, value) pairs currently on screen, None when the table is
+        # replaced by a status message - used for diff-based updates
+        self._last_shift_rows = None
+
     def load_or_prompt_shift_file(self):
         """Load shifts from cache or prompt user to select a file"""
         # Try to load from cache first
@@ -633,10 +1005,11 @@ class HospitalDisplayGUI:
             if parser.validate_month_year(today.month, today.year):
                 self.shift_parser = parser
                 self.update_shift_display()
-                print("✓ Εφημερίες φορτώθηκαν από την προσωρινή μνήμη")
+                logger.info("Εφημερίες φορτώθηκαν από την προσωρινή μνήμη")
                 return
             else:
-                print(f"⚠ Οι αποθηκευμένες εφημερίες είναι για {parser.month_number}/{parser.year}")
+                logger.warning("Οι αποθηκευμένες εφημερίες είναι για %s/%s",
+                               parser.month_number, parser.year)
 
         # Prompt user after GUI is ready
         self.root.after(1000, self.prompt_for_shift_file)
@@ -644,16 +1017,10 @@ class HospitalDisplayGUI:
     def prompt_for_shift_file(self):
         """Prompt user to select a shift file"""
         today = date.today()
-        greek_months_gen = {
-            1: "Ιανουάριο", 2: "Φεβρουάριο", 3: "Μάρτιο",
-            4: "Απρίλιο", 5: "Μάιο", 6: "Ιούνιο",
-            7: "Ιούλιο", 8: "Αύγουστο", 9: "Σεπτέμβριο",
-            10: "Οκτώβριο", 11: "Νοέμβριο", 12: "Δεκέμβριο"
-        }
 
         response = messagebox.askyesno(
             "Φόρτωση Εφημεριών",
-            f"Θέλετε να φορτώσετε το αρχείο εφημεριών για {greek_months_gen[today.month]} {today.year};\n\n"
+            f"Θέλετε να φορτώσετε το αρχείο εφημεριών για {_GREEK_MONTHS_ACC[today.month - 1]} {today.year};\n\n"
             "Χωρίς αυτό το αρχείο, δεν θα εμφανίζονται οι εφημερίες γιατρών."
         )
 
@@ -687,17 +1054,10 @@ class HospitalDisplayGUI:
         # Validate month and year
         today = date.today()
         if not parser.validate_month_year(today.month, today.year):
-            greek_months = {
-                1: "Ιανουάριος", 2: "Φεβρουάριος", 3: "Μάρτιος",
-                4: "Απρίλιος", 5: "Μάιος", 6: "Ιούνιος",
-                7: "Ιούλιος", 8: "Αύγουστος", 9: "Σεπτέμβριος",
-                10: "Οκτώβριος", 11: "Νοέμβριος", 12: "Δεκέμβριος"
-            }
-
             response = messagebox.askyesno(
                 "Προειδοποίηση",
-                f"Το αρχείο περιέχει εφημερίες για {greek_months[parser.month_number]} {parser.year}\n"
-                f"αλλά είμαστε στον {greek_months[today.month]} {today.year}.\n\n"
+                f"Το αρχείο περιέχει εφημερίες για {_GREEK_MONTHS_NOM[parser.month_number - 1]} {parser.year}\n"
+                f"αλλά είμαστε στον {_GREEK_MONTHS_NOM[today.month - 1]} {today.year}.\n\n"
                 "Θέλετε να συνεχίσετε;"
             )
 
@@ -719,255 +1079,101 @@ class HospitalDisplayGUI:
 
     def update_shift_display(self):
         """Update the shift display with information for the selected date"""
-        # Clear existing content
-        for widget in self.shift_details_frame.winfo_children():
-            widget.destroy()
-
         if not self.shift_parser:
-            # No shift data available
-            no_data = tk.Label(
-                self.shift_details_frame,
-                text="Δεν έχουν φορτωθεί εφημερίες. Πατήστε 'Φόρτωση Αρχείου' για να επιλέξετε αρχείο.",
-                font=tkfont.Font(family="Arial", size=11),
-                bg=self.card_color,
-                fg="#6C757D"
+            self._show_shift_message(
+                "Δεν έχουν φορτωθεί εφημερίες. Πατήστε 'Φόρτωση Αρχείου' για να επιλέξετε αρχείο."
             )
-            no_data.pack(expand=True)
             return
 
         # Get shift for selected date
         self.current_shift = self.shift_parser.get_shift_for_date(self.selected_date)
 
         if not self.current_shift:
-            # No shift for selected date
-            no_shift = tk.Label(
-                self.shift_details_frame,
-                text=f"Δεν βρέθηκαν εφημερίες για {self.selected_date.day}/{self.selected_date.month}/{self.selected_date.year}",
-                font=tkfont.Font(family="Arial", size=11),
-                bg=self.card_color,
-                fg="#6C757D"
+            self._show_shift_message(
+                f"Δεν βρέθηκαν εφημερίες για {self.selected_date.day}/{self.selected_date.month}/{self.selected_date.year}"
             )
-            no_shift.pack(expand=True)
             return
 
-        # Create grid layout for shift information
-        grid_frame = tk.Frame(self.shift_details_frame, bg=self.card_color)
-        grid_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
-
-        row = 0
-        label_font = tkfont.Font(family="Arial", size=12, weight="bold")
-        value_font = tkfont.Font(family="Arial", size=12)
-
-        # Attending cardiologists
-        tk.Label(
-            grid_frame,
-            text="Επιμελητές:",
-            font=label_font,
-            bg=self.card_color,
-            fg=self.text_color,
-            anchor="w"
-        ).grid(row=row, column=0, sticky="w", padx=10, pady=3)
-
-        attending_text = ", ".join(self.current_shift.attendings) if self.current_shift.attendings else "Κανένας"
-        tk.Label(
-            grid_frame,
-            text=attending_text,
-            font=value_font,
-            bg=self.card_color,
-            fg=self.text_color,
-            anchor="w"
-        ).grid(row=row, column=1, sticky="w", padx=10, pady=3)
-
-        row += 1
-
-        # Major shift (24h)
-        if self.current_shift.major_shift:
-            tk.Label(
-                grid_frame,
-                text="Μεγάλη Εφημερία (24ωρη):",
-                font=label_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=0, sticky="w", padx=10, pady=3)
-
-            tk.Label(
-                grid_frame,
-                text=self.current_shift.major_shift,
-                font=value_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=1, sticky="w", padx=10, pady=3)
-
-            row += 1
-
-        # Minor shift (24h)
-        if self.current_shift.minor_shift:
-            tk.Label(
-                grid_frame,
-                text="Μικρή Εφημερία (24ωρη):",
-                font=label_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=0, sticky="w", padx=10, pady=3)
-
-            tk.Label(
-                grid_frame,
-                text=self.current_shift.minor_shift,
-                font=value_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=1, sticky="w", padx=10, pady=3)
-
-            row += 1
-
-        # TEP cardiologist (12h)
-        if self.current_shift.tep_cardiologist:
-            tk.Label(
-                grid_frame,
-                text="Καρδιολόγος ΤΕΠ (12ωρη):",
-                font=label_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=0, sticky="w", padx=10, pady=3)
-
-            tk.Label(
-                grid_frame,
-                text=self.current_shift.tep_cardiologist,
-                font=value_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=1, sticky="w", padx=10, pady=3)
-
-            row += 1
-
-        # Cardiac Surgeon 1
-        if self.current_shift.senior_cardiac_surgeon:
-            tk.Label(
-                grid_frame,
-                text="Καρδιοχειρουργός 1:",
-                font=label_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=0, sticky="w", padx=10, pady=3)
-
-            tk.Label(
-                grid_frame,
-                text=self.current_shift.senior_cardiac_surgeon,
-                font=value_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=1, sticky="w", padx=10, pady=3)
-
-            row += 1
-
-        # Cardiac Surgeon 2
-        if self.current_shift.junior_cardiac_surgeon:
-            tk.Label(
-                grid_frame,
-                text="Καρδιοχειρουργός 2:",
-                font=label_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=0, sticky="w", padx=10, pady=3)
-
-            tk.Label(
-                grid_frame,
-                text=self.current_shift.junior_cardiac_surgeon,
-                font=value_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=1, sticky="w", padx=10, pady=3)
-
-            row += 1
-
-        # Anesthesiologist 1
-        if self.current_shift.anesthesiologist_1:
-            tk.Label(
-                grid_frame,
-                text="Αναισθησιολόγος 1:",
-                font=label_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=0, sticky="w", padx=10, pady=3)
-
-            tk.Label(
-                grid_frame,
-                text=self.current_shift.anesthesiologist_1,
-                font=value_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=1, sticky="w", padx=10, pady=3)
-
-            row += 1
-
-        # Anesthesiologist 2
-        if self.current_shift.anesthesiologist_2:
-            tk.Label(
-                grid_frame,
-                text="Αναισθησιολόγος 2:",
-                font=label_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=0, sticky="w", padx=10, pady=3)
-
-            tk.Label(
-                grid_frame,
-                text=self.current_shift.anesthesiologist_2,
-                font=value_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=1, sticky="w", padx=10, pady=3)
-
-            row += 1
+        shift = self.current_shift
+        attending_text = ", ".join(shift.attendings) if shift.attendings else "Κανένας"
+
+        # Rows to show, in display order - empty roles are filtered out in
+        # a single comprehension pass
+        rows = [("Επιμελητές:", attending_text)]
+        rows += [
+            (caption, value)
+            for attr, caption in self._SHIFT_FIELDS
+            if (value := getattr(shift, attr))
+        ]
+
+        # Diff against what is on screen - only changed cells touch Tcl,
+        # and an identical shift (e.g. re-saving without edits) is a no-op
+        if rows == self._last_shift_rows:
+            return
+        # Locals for the loop - LOAD_FAST instead of repeated self lookups
+        previous = self._last_shift_rows or []
+        num_rows = len(rows)
+        num_prev = len(previous)
+
+        self._shift_message.pack_forget()
+        self._shift_grid.pack(fill=tk.BOTH, expand=True, pady=(0, 5))
+        for i, (name_label, value_label) in enumerate(self._shift_cells):
+            new_row = rows[i] if i < num_rows else None
+            if new_row == (previous[i] if i < num_prev else None):
+                continue
+            if new_row is not None:
+                caption, value = new_row
+                name_label.config(text=caption)
+                value_label.config(text=value)
+                name_label.grid()
+                value_label.grid()
+            else:
+                name_label.grid_remove()
+                value_label.grid_remove()
+        self._last_shift_rows = rows
 
-        # Pediatric Cardiologist
-        if self.current_shift.pediatric_cardiologist:
-            tk.Label(
-                grid_frame,
-                text="Παιδοκαρδιολόγος:",
-                font=label_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=0, sticky="w", padx=10, pady=3)
-
-            tk.Label(
-                grid_frame,
-                text=self.current_shift.pediatric_cardiologist,
-                font=value_font,
-                bg=self.card_color,
-                fg=self.text_color,
-                anchor="w"
-            ).grid(row=row, column=1, sticky="w", padx=10, pady=3)
+    def _show_shift_message(self, text: str):
+        """Show a status message in place of the shift table"""
+        self._last_shift_rows = None
+        self._shift_grid.pack_forget()
+        self._shift_message.config(text=text)
+        self._shift_message.pack(expand=True)
 
     def previous_day(self):
         """Navigate to previous day"""
         self.selected_date = self.selected_date - timedelta(days=1)
-        print(f"\n← Μετάβαση στην προηγούμενη ημέρα: {self.selected_date.strftime('%Y-%m-%d')}")
-        self.refresh_data()
+        logger.debug("Μετάβαση στην προηγούμενη ημέρα: %s", self.selected_date.isoformat())
+        self._schedule_refresh()
 
     def next_day(self):
         """Navigate to next day"""
         self.selected_date = self.selected_date + timedelta(days=1)
-        print(f"\n→ Μετάβαση στην επόμενη ημέρα: {self.selected_date.strftime('%Y-%m-%d')}")
-        self.refresh_data()
+        logger.debug("Μετάβαση στην επόμενη ημέρα: %s", self.selected_date.isoformat())
+        self._schedule_refresh()
 
     def open_calendar(self):
         """Open calendar dialog to select a date"""
+        dialog = self._get_calendar_dialog()
+
+        # Point the calendar at the current selection before showing it
+        self._cal_widget.selection_set(self.selected_date)
+
+        dialog.deiconify()
+        dialog.grab_set()
+
+    def _get_calendar_dialog(self):
+        """Build the calendar dialog once; later opens just deiconify it
+
+        tkcalendar's Calendar widget takes hundreds of milliseconds to
+        construct, so the dialog is hidden with withdraw() on close and
+        reused instead of being destroyed and rebuilt per click.
+        """
+        if self._cal_dialog is not None:
+            return self._cal_dialog
+
+        # tkcalendar is only needed for this dialog - import it on first use
+        from tkcalendar import Calendar
+
         # Create calendar dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Επιλογή Ημερομηνίας")
@@ -976,13 +1182,13 @@ class HospitalDisplayGUI:
 
         # Make dialog modal
         dialog.transient(self.root)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._close_calendar)
 
         # Title
         title = tk.Label(
             dialog,
             text="Επιλέξτε Ημερομηνία",
-            font=tkfont.Font(family="Arial", size=14, weight="bold"),
+            font=self._fonts['section'],
             bg=self.bg_color,
             fg=self.highlight_color
         )
@@ -1018,11 +1224,11 @@ class HospitalDisplayGUI:
 
         def select_date():
             """Handle date selection"""
-            selected = cal.get_date()
-            # Parse the date string (format: yyyy-mm-dd)
-            self.selected_date = datetime.strptime(selected, '%Y-%m-%d').date()
-            print(f"\n📅 Επιλέχθηκε ημερομηνία: {self.selected_date.strftime('%Y-%m-%d')}")
-            dialog.destroy()
+            # selection_get() hands back a datetime.date directly - no
+            # round-trip through the formatted string
+            self.selected_date = cal.selection_get()
+            logger.debug("Επιλέχθηκε ημερομηνία: %s", self.selected_date.isoformat())
+            self._close_calendar()
             self.refresh_data()
 
         select_btn = tk.Button(
@@ -1031,7 +1237,7 @@ class HospitalDisplayGUI:
             command=select_date,
             bg=self.accent_color,
             fg="white",
-            font=tkfont.Font(family="Arial", size=11),
+            font=self._fonts['body'],
             relief=tk.FLAT,
             padx=20,
             pady=8
@@ -1044,7 +1250,7 @@ class HospitalDisplayGUI:
             command=lambda: self.select_today(dialog),
             bg=self.secondary_blue,
             fg="white",
-            font=tkfont.Font(family="Arial", size=11),
+            font=self._fonts['body'],
             relief=tk.FLAT,
             padx=20,
             pady=8
@@ -1054,22 +1260,32 @@ class HospitalDisplayGUI:
         cancel_btn = tk.Button(
             button_frame,
             text="Ακύρωση",
-            command=dialog.destroy,
+            command=self._close_calendar,
             bg="#6C757D",
             fg="white",
-            font=tkfont.Font(family="Arial", size=11),
+            font=self._fonts['body'],
             relief=tk.FLAT,
             padx=20,
             pady=8
         )
         cancel_btn.pack(side=tk.LEFT, padx=5)
 
+        self._cal_dialog = dialog
+        self._cal_widget = cal
+        return dialog
+
+    def _close_calendar(self):
+        """Hide the pooled calendar dialog without destroying it"""
+        self._cal_dialog.grab_release()
+        self._cal_dialog.withdraw()
+
     def select_today(self, dialog=None):
         """Select today's date"""
         self.selected_date = date.today()
-        print(f"\n📅 Επιλέχθηκε σημερινή ημερομηνία: {self.selected_date.strftime('%Y-%m-%d')}")
+        logger.debug("Επιλέχθηκε σημερινή ημερομηνία: %s", self.selected_date.isoformat())
         if dialog:
-            dialog.destroy()
+            dialog.grab_release()
+            dialog.withdraw()
         self.refresh_data()
 
     def edit_shifts(self):
@@ -1088,6 +1304,35 @@ class HospitalDisplayGUI:
             )
             return
 
+        dialog = self._get_edit_dialog()
+
+        # Point the pooled form at the selected day's shift
+        shift = self.current_shift
+        self._edit_title.config(
+            text=f"Επεξεργασία Εφημεριών - {shift.day} {shift.month_name}"
+        )
+        values = {'attendings': ", ".join(shift.attendings)}
+        for attr, _ in self._SHIFT_FIELDS:
+            values[attr] = getattr(shift, attr) or ""
+        for attr, entry in self._edit_entries.items():
+            entry.delete(0, tk.END)
+            entry.insert(0, values[attr])
+
+        dialog.deiconify()
+        dialog.grab_set()
+
+    def _get_edit_dialog(self):
+        """Build the shift-edit dialog once; later opens refill the fields
+
+        The Toplevel and its nine Label/Entry rows are created on first use
+        and then hidden with withdraw() on close, so reopening the editor
+        costs a handful of Entry refills instead of ~20 widget
+        constructions. The entries are read directly with get() - no
+        StringVar, so keystrokes skip the Tcl variable trace machinery.
+        """
+        if self._edit_dialog is not None:
+            return self._edit_dialog
+
         # Create edit dialog
         dialog = tk.Toplevel(self.root)
         dialog.title("Επεξεργασία Εφημεριών")
@@ -1096,177 +1341,40 @@ class HospitalDisplayGUI:
 
         # Make dialog modal
         dialog.transient(self.root)
-        dialog.grab_set()
+        dialog.protocol("WM_DELETE_WINDOW", self._close_edit_dialog)
 
-        # Title
-        title = tk.Label(
+        # Title - the day/month part is set on each open
+        self._edit_title = tk.Label(
             dialog,
-            text=f"Επεξεργασία Εφημεριών - {self.current_shift.day} {self.current_shift.month_name}",
-            font=tkfont.Font(family="Arial", size=14, weight="bold"),
+            font=self._fonts['section'],
             bg=self.bg_color,
             fg=self.highlight_color
         )
-        title.pack(pady=10)
+        self._edit_title.pack(pady=10)
 
         # Form frame
         form_frame = tk.Frame(dialog, bg=self.bg_color)
         form_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=10)
 
-        label_font = tkfont.Font(family="Arial", size=11)
-        entry_font = tkfont.Font(family="Arial", size=11)
-
-        # Attending cardiologists
-        tk.Label(
-            form_frame,
-            text="Επιμελητές (διαχωρισμός με κόμμα):",
-            font=label_font,
-            bg=self.bg_color
-        ).grid(row=0, column=0, sticky="w", pady=5)
-
-        attending_var = tk.StringVar(value=", ".join(self.current_shift.attendings))
-        attending_entry = tk.Entry(
-            form_frame,
-            textvariable=attending_var,
-            font=entry_font,
-            width=40
-        )
-        attending_entry.grid(row=0, column=1, sticky="ew", pady=5, padx=(10, 0))
-
-        # Major shift
-        tk.Label(
-            form_frame,
-            text="Μεγάλη Εφημερία (24ωρη):",
-            font=label_font,
-            bg=self.bg_color
-        ).grid(row=1, column=0, sticky="w", pady=5)
-
-        major_var = tk.StringVar(value=self.current_shift.major_shift or "")
-        major_entry = tk.Entry(
-            form_frame,
-            textvariable=major_var,
-            font=entry_font,
-            width=40
-        )
-        major_entry.grid(row=1, column=1, sticky="ew", pady=5, padx=(10, 0))
-
-        # Minor shift
-        tk.Label(
-            form_frame,
-            text="Μικρή Εφημερία (24ωρη):",
-            font=label_font,
-            bg=self.bg_color
-        ).grid(row=2, column=0, sticky="w", pady=5)
-
-        minor_var = tk.StringVar(value=self.current_shift.minor_shift or "")
-        minor_entry = tk.Entry(
-            form_frame,
-            textvariable=minor_var,
-            font=entry_font,
-            width=40
-        )
-        minor_entry.grid(row=2, column=1, sticky="ew", pady=5, padx=(10, 0))
-
-        # TEP cardiologist
-        tk.Label(
-            form_frame,
-            text="Καρδιολόγος ΤΕΠ (12ωρη):",
-            font=label_font,
-            bg=self.bg_color
-        ).grid(row=3, column=0, sticky="w", pady=5)
-
-        tep_var = tk.StringVar(value=self.current_shift.tep_cardiologist or "")
-        tep_entry = tk.Entry(
-            form_frame,
-            textvariable=tep_var,
-            font=entry_font,
-            width=40
-        )
-        tep_entry.grid(row=3, column=1, sticky="ew", pady=5, padx=(10, 0))
-
-        # Cardiac Surgeon 1
-        tk.Label(
-            form_frame,
-            text="Καρδιοχειρουργός 1:",
-            font=label_font,
-            bg=self.bg_color
-        ).grid(row=4, column=0, sticky="w", pady=5)
-
-        senior_surgeon_var = tk.StringVar(value=self.current_shift.senior_cardiac_surgeon or "")
-        senior_surgeon_entry = tk.Entry(
-            form_frame,
-            textvariable=senior_surgeon_var,
-            font=entry_font,
-            width=40
-        )
-        senior_surgeon_entry.grid(row=4, column=1, sticky="ew", pady=5, padx=(10, 0))
-
-        # Cardiac Surgeon 2
-        tk.Label(
-            form_frame,
-            text="Καρδιοχειρουργός 2:",
-            font=label_font,
-            bg=self.bg_color
-        ).grid(row=5, column=0, sticky="w", pady=5)
-
-        junior_surgeon_var = tk.StringVar(value=self.current_shift.junior_cardiac_surgeon or "")
-        junior_surgeon_entry = tk.Entry(
-            form_frame,
-            textvariable=junior_surgeon_var,
-            font=entry_font,
-            width=40
-        )
-        junior_surgeon_entry.grid(row=5, column=1, sticky="ew", pady=5, padx=(10, 0))
-
-        # Anesthesiologist 1
-        tk.Label(
-            form_frame,
-            text="Αναισθησιολόγος 1:",
-            font=label_font,
-            bg=self.bg_color
-        ).grid(row=6, column=0, sticky="w", pady=5)
-
-        anesthesiologist_1_var = tk.StringVar(value=self.current_shift.anesthesiologist_1 or "")
-        anesthesiologist_1_entry = tk.Entry(
-            form_frame,
-            textvariable=anesthesiologist_1_var,
-            font=entry_font,
-            width=40
-        )
-        anesthesiologist_1_entry.grid(row=6, column=1, sticky="ew", pady=5, padx=(10, 0))
-
-        # Anesthesiologist 2
-        tk.Label(
-            form_frame,
-            text="Αναισθησιολόγος 2:",
-            font=label_font,
-            bg=self.bg_color
-        ).grid(row=7, column=0, sticky="w", pady=5)
-
-        anesthesiologist_2_var = tk.StringVar(value=self.current_shift.anesthesiologist_2 or "")
-        anesthesiologist_2_entry = tk.Entry(
-            form_frame,
-            textvariable=anesthesiologist_2_var,
-            font=entry_font,
-            width=40
-        )
-        anesthesiologist_2_entry.grid(row=7, column=1, sticky="ew", pady=5, padx=(10, 0))
-
-        # Pediatric Cardiologist
-        tk.Label(
-            form_frame,
-            text="Παιδοκαρδιολόγος:",
-            font=label_font,
-            bg=self.bg_color
-        ).grid(row=8, column=0, sticky="w", pady=5)
-
-        pediatric_cardiologist_var = tk.StringVar(value=self.current_shift.pediatric_cardiologist or "")
-        pediatric_cardiologist_entry = tk.Entry(
-            form_frame,
-            textvariable=pediatric_cardiologist_var,
-            font=entry_font,
-            width=40
-        )
-        pediatric_cardiologist_entry.grid(row=8, column=1, sticky="ew", pady=5, padx=(10, 0))
+        body_font = self._fonts['body']
+        fields = (
+            ("attendings", "Επιμελητές (διαχωρισμός με κόμμα):"),
+        ) + self._SHIFT_FIELDS
+        for row, (attr, caption) in enumerate(fields):
+            tk.Label(
+                form_frame,
+                text=caption,
+                font=body_font,
+                bg=self.bg_color
+            ).grid(row=row, column=0, sticky="w", pady=5)
+
+            entry = tk.Entry(
+                form_frame,
+                font=body_font,
+                width=40
+            )
+            entry.grid(row=row, column=1, sticky="ew", pady=5, padx=(10, 0))
+            self._edit_entries[attr] = entry
 
         form_frame.columnconfigure(1, weight=1)
 
@@ -1274,35 +1382,13 @@ class HospitalDisplayGUI:
         button_frame = tk.Frame(dialog, bg=self.bg_color)
         button_frame.pack(pady=10)
 
-        def save_changes():
-            """Save the edited shifts"""
-            # Update parser for selected date
-            self.shift_parser.update_shift(self.selected_date.day, 'attendings', attending_var.get())
-            self.shift_parser.update_shift(self.selected_date.day, 'major_shift', major_var.get())
-            self.shift_parser.update_shift(self.selected_date.day, 'minor_shift', minor_var.get())
-            self.shift_parser.update_shift(self.selected_date.day, 'tep_cardiologist', tep_var.get())
-            self.shift_parser.update_shift(self.selected_date.day, 'senior_cardiac_surgeon', senior_surgeon_var.get())
-            self.shift_parser.update_shift(self.selected_date.day, 'junior_cardiac_surgeon', junior_surgeon_var.get())
-            self.shift_parser.update_shift(self.selected_date.day, 'anesthesiologist_1', anesthesiologist_1_var.get())
-            self.shift_parser.update_shift(self.selected_date.day, 'anesthesiologist_2', anesthesiologist_2_var.get())
-            self.shift_parser.update_shift(self.selected_date.day, 'pediatric_cardiologist', pediatric_cardiologist_var.get())
-
-            # Save to cache
-            self.shift_parser.save_to_json(self.shift_cache_file)
-
-            # Refresh display
-            self.update_shift_display()
-
-            messagebox.showinfo("Επιτυχία", "Οι αλλαγές αποθηκεύτηκαν επιτυχώς!")
-            dialog.destroy()
-
         save_btn = tk.Button(
             button_frame,
             text="Αποθήκευση",
-            command=save_changes,
+            command=self._save_shift_edits,
             bg=self.accent_color,
             fg="white",
-            font=tkfont.Font(family="Arial", size=11),
+            font=self._fonts['body'],
             relief=tk.FLAT,
             padx=20,
             pady=8
@@ -1312,20 +1398,57 @@ class HospitalDisplayGUI:
         cancel_btn = tk.Button(
             button_frame,
             text="Ακύρωση",
-            command=dialog.destroy,
+            command=self._close_edit_dialog,
             bg="#6C757D",
             fg="white",
-            font=tkfont.Font(family="Arial", size=11),
+            font=self._fonts['body'],
             relief=tk.FLAT,
             padx=20,
             pady=8
         )
         cancel_btn.pack(side=tk.LEFT, padx=5)
 
+        self._edit_dialog = dialog
+        return dialog
+
+    def _save_shift_edits(self):
+        """Save the edited shifts"""
+        # Apply the field changes in-memory on the GUI thread...
+        updates = {attr: entry.get() for attr, entry in self._edit_entries.items()}
+        self.shift_parser.update_shift_fields(
+            self.selected_date.day, updates, filepath=None
+        )
+
+        # ...but push the disk write to the I/O worker so a slow disk can't
+        # stall the event loop; the result is polled via after()
+        future = self._io_pool.submit(
+            self.shift_parser.save_to_json, self.shift_cache_file
+        )
+        self.root.after(50, self._poll_save, future)
+
+        # Refresh display
+        self.update_shift_display()
+        self._close_edit_dialog()
+
+    def _poll_save(self, future):
+        """Check the background cache write and report the outcome"""
+        if not future.done():
+            self.root.after(50, self._poll_save, future)
+            return
+        error = future.exception()
+        if error is not None:
+            logger.error("Σφάλμα αποθήκευσης εφημεριών: %s", error)
+            messagebox.showerror("Σφάλμα", "Αδυναμία αποθήκευσης των αλλαγών.")
+        else:
+            messagebox.showinfo("Επιτυχία", "Οι αλλαγές αποθηκεύτηκαν επιτυχώς!")
+
+    def _close_edit_dialog(self):
+        """Hide the pooled edit dialog without destroying it"""
+        self._edit_dialog.grab_release()
+        self._edit_dialog.withdraw()
+
     def schedule_daily_refresh(self):
         """Schedule daily refresh at 08:00"""
-        from datetime import datetime, timedelta
-
         now = datetime.now()
 
         # Calculate next 08:00
@@ -1335,30 +1458,36 @@ class HospitalDisplayGUI:
         if now >= target_time:
             target_time += timedelta(days=1)
 
-        # Calculate milliseconds until target time
-        time_until_refresh = (target_time - now).total_seconds() * 1000
+        # Milliseconds until the target time, clamped in case 08:00 was hit
+        # exactly - recomputing from the wall clock each tick means drift
+        # can't accumulate across days
+        time_until_refresh = max(0, int((target_time - now).total_seconds() * 1000))
 
-        print(f"\n[ΠΡΟΓΡΑΜΜΑΤΙΣΜΟΣ] Επόμενη αυτόματη ανανέωση: {target_time.strftime('%Y-%m-%d %H:%M:%S')}")
+        logger.info("Επόμενη αυτόματη ανανέωση: %s", target_time.strftime('%Y-%m-%d %H:%M:%S'))
 
         # Schedule the refresh
-        self.root.after(int(time_until_refresh), self.auto_refresh)
+        self.root.after(time_until_refresh, self.auto_refresh)
 
     def auto_refresh(self):
         """Auto-refresh data at 08:00 and schedule next refresh"""
-        print("\n[ΑΥΤΟΜΑΤΗ ΑΝΑΝΕΩΣΗ] Ενεργοποιήθηκε καθημερινή ανανέωση δεδομένων στις 08:00")
+        logger.info("Ενεργοποιήθηκε καθημερινή ανανέωση δεδομένων στις 08:00")
 
         # Reset to today's date when auto-refreshing
         self.selected_date = date.today()
 
-        self.refresh_data()
-        self.update_shift_display()
+        # refresh_data repaints the shift section too, so no separate
+        # update_shift_display call is needed here; force past the
+        # per-date cache so today's data is actually refetched
+        self.refresh_data(force=True)
 
-        # Schedule next daily refresh
+        # Arm the timer for the next 08:00 - each tick schedules the next
         self.schedule_daily_refresh()
 
 
 def main():
     """Main function to run the GUI application"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+
     root = tk.Tk()
     app = HospitalDisplayGUI(root)
 
@@ -1375,4 +1504,8 @@ def main():
 
 
 if __name__ == "__main__":
+    # In the PyInstaller build, spawned worker processes re-execute this
+    # binary; freeze_support() makes them exit instead of opening a new GUI
+    import multiprocessing
+    multiprocessing.freeze_support()
     main()
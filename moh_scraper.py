@@ -4,18 +4,60 @@ Ministry of Health Hospital Duty Scraper
 Scrapes on-duty hospital schedules from official Greek government PDF/DOC files
 """
 
+import hashlib
+import io
+import json
+import multiprocessing
+import os
 import re
+import subprocess
+import sys
 import requests
 import pdfplumber
-import olefile
+
+try:
+    import requests_cache
+except ImportError:  # optional - plain sessions refetch on every call
+    requests_cache = None
+
+try:
+    import fitz  # PyMuPDF - C-native table extraction
+except ImportError:  # optional - pdfplumber path still works
+    fitz = None
 from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, date, timedelta
+from functools import partial
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-import io
-
 
-@dataclass
+# Patterns used once per link/cell/line while parsing - compiled at import
+# so the hot loops skip the re-cache probe on every call
+_FDL_RE = re.compile(r'fdl=(\d+)')
+# Download anchors pulled straight from the raw page bytes - captures
+# (href, fdl, anchor text) without building a DOM or decoding the page
+_ANCHOR_RE = re.compile(
+    rb'<a[^>]+href="([^"]*fdl=(\d+)[^"]*)"[^>]*>([^<]+)</a>',
+    re.IGNORECASE,
+)
+_DASH_RE = re.compile(r'\s*[–-]\s*')
+_TIME_NOTE_RE = re.compile(r'έως\s+\d{2}:\d{2}')
+_PREFIX_RE = re.compile(r'^[ΓΠΝ\.Ο\.Κ\s]+')
+_GENERIC_PREFIX_RE = re.compile(r'Π\.Γ\.Ν\.|Γ\.Ο\.Ν\.Κ\.|Γ\.Ν\.|Ν\.')
+
+# Cell lines that name only a hospital category or an area, never a hospital
+_BARE_PREFIXES = frozenset(['Γ.Ν.Α.', 'Γ.Ν.Ν.', 'Γ.Ο.Ν.Κ.', 'Π.Γ.Ν.'])
+_AREA_LINES = frozenset(['ΠΕΙΡΑΙΑΣ', 'ΑΘΗΝΑ', 'ΠΕΡΙΣΤΕΡΙ'])
+
+# Genitive month names as used in the MOH file titles, indexed by month
+_GREEK_MONTHS = (
+    None, "ΙΑΝΟΥΑΡΙΟΥ", "ΦΕΒΡΟΥΑΡΙΟΥ", "ΜΑΡΤΙΟΥ", "ΑΠΡΙΛΙΟΥ", "ΜΑΪΟΥ",
+    "ΙΟΥΝΙΟΥ", "ΙΟΥΛΙΟΥ", "ΑΥΓΟΥΣΤΟΥ", "ΣΕΠΤΕΜΒΡΙΟΥ", "ΟΚΤΩΒΡΙΟΥ",
+    "ΝΟΕΜΒΡΙΟΥ", "ΔΕΚΕΜΒΡΙΟΥ",
+)
+
+
+@dataclass(slots=True)
 class Hospital:
     """Represents a hospital with its duty schedule"""
     name: str
@@ -25,6 +67,38 @@ class Hospital:
     address: str = ""
     phone: str = ""
     area: str = ""
+    # Lowercased/sigma-folded specialty, precomputed so filter predicates
+    # skip a Greek .lower() per hospital per refresh
+    specialty_key: str = ""
+
+
+def hospital_to_dict(h: Hospital) -> Dict[str, str]:
+    """Serialize a Hospital with straight attribute loads (no reflection)"""
+    return {
+        'name': h.name,
+        'specialty': h.specialty,
+        'time_slot': h.time_slot,
+        'on_duty_date': h.on_duty_date,
+        'address': h.address,
+        'phone': h.phone,
+        'area': h.area,
+        'specialty_key': h.specialty_key,
+    }
+
+
+def _user_cache_dir() -> str:
+    """Per-user cache directory for downloaded/converted/parsed files
+
+    Deliberately not the world-writable system temp dir: predictable file
+    names there let any local user pre-plant content or symlinks. The
+    directory is created 0o700 so only the owning user can read or write it.
+    """
+    base = os.environ.get('XDG_CACHE_HOME') or os.path.join(
+        os.path.expanduser('~'), '.cache'
+    )
+    path = os.path.join(base, 'moh_scraper')
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    return path
 
 
 class MOHHospitalScraper:
@@ -62,6 +136,16 @@ class MOHHospitalScraper:
         "ΑΓ. ΠΑΝΤΕΛΕΗΜΩΝ": "Νοσοκομείο «Άγιος Παντελεήμων»",
     }
 
+    # Abbreviations sorted longest-first so keys sharing a prefix resolve to
+    # the most specific match, baked into one alternation regex - each line
+    # is then scanned once in C instead of ~26 Python substring checks
+    _HOSPITAL_ITEMS = tuple(
+        sorted(HOSPITAL_NAMES.items(), key=lambda kv: -len(kv[0]))
+    )
+    _HOSPITAL_RE = re.compile(
+        '|'.join(re.escape(abbr) for abbr, _ in _HOSPITAL_ITEMS)
+    )
+
     # Specialty name normalization
     SPECIALTY_NAMES = {
         "Παθολογική": "Παθολογία / Internal Medicine",
@@ -95,7 +179,15 @@ class MOHHospitalScraper:
     }
 
     def __init__(self):
-        self.session = requests.Session()
+        if requests_cache is not None:
+            # Conditional GETs (If-None-Match / If-Modified-Since) served
+            # from a local sqlite cache - repeat index fetches and file
+            # downloads within the hour cost a disk read, not a round-trip
+            self.session = requests_cache.CachedSession(
+                'moh_cache', expire_after=3600, cache_control=True
+            )
+        else:
+            self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36'
         })
@@ -108,27 +200,16 @@ class MOHHospitalScraper:
         try:
             response = self.session.get(self.BASE_URL)
             response.raise_for_status()
-            soup = BeautifulSoup(response.text, 'html.parser')
-
             files = []
-            links = soup.find_all('a', href=True)
+            for text, fdl in self._extract_links(response.content):
+                if '2025' in text or '2024' in text:
+                    # Check if PDF or DOC based on text
+                    if '.pdf' in text.lower():
+                        file_type = 'pdf'
+                    else:
+                        file_type = 'doc'
 
-            for link in links:
-                href = link.get('href', '')
-                text = link.get_text(strip=True)
-
-                if 'fdl=' in href and ('2025' in text or '2024' in text):
-                    # Extract fdl number
-                    fdl_match = re.search(r'fdl=(\d+)', href)
-                    if fdl_match:
-                        fdl = fdl_match.group(1)
-                        # Check if PDF or DOC based on text
-                        if '.pdf' in text.lower():
-                            file_type = 'pdf'
-                        else:
-                            file_type = 'doc'
-
-                        files.append((text, fdl, file_type))
+                    files.append((text, fdl, file_type))
 
             return files
 
@@ -136,6 +217,29 @@ class MOHHospitalScraper:
             print(f"Error fetching file list: {e}")
             return []
 
+    @staticmethod
+    def _extract_links(content: bytes) -> List[Tuple[str, str]]:
+        """
+        Pull (anchor text, fdl) pairs for download links out of the page
+        The raw-bytes regex avoids building a DOM for the whole page; if it
+        finds suspiciously few links (markup changed), fall back to a real
+        HTML parse so a cosmetic page redesign doesn't blank the file list
+        """
+        links = [
+            (m.group(3).decode('utf-8', 'replace').strip(), m.group(2).decode())
+            for m in _ANCHOR_RE.finditer(content)
+        ]
+        if len(links) >= 10:
+            return links
+
+        soup = BeautifulSoup(content, 'lxml')
+        links = []
+        for anchor in soup.select('a[href*="fdl="]'):
+            fdl_match = _FDL_RE.search(anchor.get('href', ''))
+            if fdl_match:
+                links.append((anchor.get_text(strip=True), fdl_match.group(1)))
+        return links
+
     def download_file(self, fdl: str) -> Optional[bytes]:
         """Download a file by its fdl parameter"""
         try:
@@ -152,102 +256,154 @@ class MOHHospitalScraper:
         hospitals = []
 
         try:
-            with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
-                for page in pdf.pages:
-                    # Extract tables
-                    tables = page.extract_tables()
-
-                    for table in tables:
-                        if not table or len(table) < 2:
-                            continue
-
-                        # Find header row to identify columns
-                        header_row = None
-                        for i, row in enumerate(table[:5]):  # Check first 5 rows instead of 3
-                            if row and 'ΚΛΙΝΙΚ' in str(row).upper():
-                                header_row = i
-                                break
-
-                        if header_row is None:
-                            continue
-
-                        # Extract time slot labels from header row
-                        header = table[header_row]
-                        time_slots = []
-                        for col_idx in range(1, len(header)):
-                            cell = header[col_idx]
-                            if cell and cell.strip() and 'ΠΑΡΑΤΗΡΗΣ' not in cell and 'Κλινικ' not in cell.upper():
-                                # Clean up the time slot label
-                                time_label = cell.strip()
-                                # Normalize formatting (remove extra spaces around dash)
-                                time_label = re.sub(r'\s*–\s*', '-', time_label)
-                                time_label = re.sub(r'\s*-\s*', '-', time_label)
-                                time_slots.append((time_label, col_idx))
-
-                        # Parse each row after header
-                        for row in table[header_row + 1:]:
-                            if not row or len(row) < 2:
-                                continue
-
-                            specialty = row[0].strip() if row[0] else ""
-                            if not specialty or specialty == "Κλινικές":
-                                continue
-
-                            # Normalize specialty name
-                            specialty_display = self.SPECIALTY_NAMES.get(
-                                specialty, specialty
-                            )
-
-                            # Extract hospitals from time slot columns
-                            for time_label, col_idx in time_slots:
-                                if col_idx < len(row):
-                                    cell_text = row[col_idx]
-                                    # Skip empty cells and cells with only whitespace
-                                    if cell_text and cell_text.strip():
-                                        # Extract hospital names from cell
-                                        hospital_names = self._extract_hospital_names(
-                                            cell_text
-                                        )
-
-                                        for hosp_name in hospital_names:
-                                            hospitals.append(
-                                                Hospital(
-                                                    name=hosp_name,
-                                                    specialty=specialty_display,
-                                                    time_slot=time_label,
-                                                    on_duty_date=duty_date,
-                                                )
-                                            )
+            if fitz is not None:
+                with fitz.open(stream=pdf_content, filetype="pdf") as doc:
+                    n_pages = doc.page_count
+            else:
+                with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
+                    n_pages = len(pdf.pages)
+
+            if n_pages > 1 and not getattr(sys, 'frozen', False):
+                # extract_tables is CPU-bound pdfminer work, so fan the
+                # pages out to worker processes; each worker re-opens the
+                # PDF bytes and extracts just its page. Skipped in frozen
+                # (PyInstaller) builds, where spawned workers would
+                # re-execute the bundled GUI executable. Spawn rather than
+                # fork: this runs on a background thread of the Tk process,
+                # and forking a multithreaded process can deadlock children
+                with ProcessPoolExecutor(
+                    max_workers=min(4, os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context('spawn'),
+                ) as executor:
+                    page_results = executor.map(
+                        partial(_parse_page_tables, pdf_content, duty_date=duty_date),
+                        range(n_pages),
+                    )
+                    for page_hospitals in page_results:
+                        hospitals.extend(page_hospitals)
+            else:
+                for page_idx in range(n_pages):
+                    hospitals.extend(
+                        _parse_page_tables(pdf_content, page_idx, duty_date=duty_date)
+                    )
 
         except Exception as e:
             print(f"Error parsing PDF: {e}")
 
         return hospitals
 
-    def parse_doc(self, doc_content: bytes, duty_date: str) -> List[Hospital]:
-        """Parse old DOC file and extract hospital duty information"""
+    @classmethod
+    def _parse_tables(cls, tables, duty_date: str) -> List[Hospital]:
+        """Turn one page's extracted tables into Hospital entries"""
         hospitals = []
 
-        try:
-            # Use olefile to read old .doc format
-            ole = olefile.OleFileIO(doc_content)
+        for table in tables:
+            if not table or len(table) < 2:
+                continue
+
+            # Find header row to identify columns - probe the cells
+            # themselves rather than str(row), which builds the whole
+            # row's repr just to run one substring test
+            header_row = None
+            for i, row in enumerate(table[:5]):  # Check first 5 rows instead of 3
+                if row and any(cell and 'ΚΛΙΝΙΚ' in cell.upper() for cell in row):
+                    header_row = i
+                    break
 
-            # Extract text from WordDocument stream
-            if ole.exists('WordDocument'):
-                word_stream = ole.openstream('WordDocument')
-                # This is a simplified approach - old DOC format is complex
-                # For production, consider using libreoffice --convert-to or similar
-                print("DOC parsing: Old format detected, attempting text extraction")
+            if header_row is None:
+                continue
+
+            # Extract time slot labels from header row
+            header = table[header_row]
+            time_slots = []
+            for col_idx in range(1, len(header)):
+                cell = header[col_idx]
+                if cell and cell.strip() and 'ΠΑΡΑΤΗΡΗΣ' not in cell and 'Κλινικ' not in cell.upper():
+                    # Clean up the time slot label
+                    time_label = cell.strip()
+                    # Normalize formatting (remove extra spaces around dash)
+                    time_label = _DASH_RE.sub('-', time_label)
+                    time_slots.append((time_label, col_idx))
+
+            # Parse each row after header
+            for row in table[header_row + 1:]:
+                if not row or len(row) < 2:
+                    continue
+
+                specialty = row[0].strip() if row[0] else ""
+                if not specialty or specialty == "Κλινικές":
+                    continue
+
+                # Normalize specialty name
+                specialty_display = cls.SPECIALTY_NAMES.get(
+                    specialty, specialty
+                )
+                # Final sigma folds to σ so substring checks need one form
+                specialty_key = specialty_display.casefold().replace('ς', 'σ')
+
+                # Extract hospitals from time slot columns
+                for time_label, col_idx in time_slots:
+                    if col_idx < len(row):
+                        cell_text = row[col_idx]
+                        # Skip empty cells and cells with only whitespace
+                        if cell_text and cell_text.strip():
+                            # Extract hospital names from cell
+                            hospital_names = cls._extract_hospital_names(
+                                cell_text
+                            )
 
-                # For now, return empty list - DOC parsing requires more complex handling
-                # Alternative: Convert DOC to PDF first using external tool
+                            for hosp_name in hospital_names:
+                                hospitals.append(
+                                    Hospital(
+                                        name=hosp_name,
+                                        specialty=specialty_display,
+                                        time_slot=time_label,
+                                        on_duty_date=duty_date,
+                                        specialty_key=specialty_key,
+                                    )
+                                )
 
+        return hospitals
+
+    def parse_doc(self, doc_content: bytes, duty_date: str) -> List[Hospital]:
+        """Parse old DOC file by converting it to PDF and reusing parse_pdf"""
+        try:
+            pdf_content = self._convert_doc_to_pdf(doc_content)
         except Exception as e:
             print(f"Error parsing DOC: {e}")
+            return []
 
-        return hospitals
+        if not pdf_content:
+            return []
+        return self.parse_pdf(pdf_content, duty_date)
+
+    @staticmethod
+    def _convert_doc_to_pdf(doc_content: bytes) -> Optional[bytes]:
+        """Convert DOC bytes to PDF via headless LibreOffice, cached on disk
 
-    def _extract_hospital_names(self, text: str) -> List[str]:
+        The converted file is keyed by content hash, so re-parsing the same
+        day's schedule skips the subprocess entirely.
+        """
+        digest = hashlib.sha1(doc_content).hexdigest()
+        cache_dir = _user_cache_dir()
+        pdf_path = os.path.join(cache_dir, f"moh_{digest}.pdf")
+
+        if not os.path.exists(pdf_path):
+            doc_path = os.path.join(cache_dir, f"moh_{digest}.doc")
+            with open(doc_path, 'wb') as f:
+                f.write(doc_content)
+            subprocess.run(
+                ["libreoffice", "--headless", "--convert-to", "pdf",
+                 "--outdir", cache_dir, doc_path],
+                timeout=60, check=True,
+                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+            )
+
+        with open(pdf_path, 'rb') as f:
+            return f.read()
+
+    @classmethod
+    def _extract_hospital_names(cls, text: str) -> List[str]:
         """Extract hospital names from cell text"""
         if not text or text.strip() == "":
             return []
@@ -255,7 +411,7 @@ class MOHHospitalScraper:
         hospital_names = []
 
         # Remove time annotations like "έως 23:00", "έως 20:00", etc.
-        text = re.sub(r'έως\s+\d{2}:\d{2}', '', text)
+        text = _TIME_NOTE_RE.sub('', text)
         text = text.strip()
 
         # Split only by newlines (keep Γ.Ν. intact)
@@ -267,32 +423,24 @@ class MOHHospitalScraper:
                 continue
 
             # Skip generic prefixes that don't specify a hospital
-            # "Γ.Ν.Α." alone means "General Hospital of Athens" but doesn't specify which one
-            if line in ['Γ.Ν.Α.', 'Γ.Ν.Ν.', 'Γ.Ο.Ν.Κ.', 'Π.Γ.Ν.']:
-                continue
-
-            # Skip area names that are just location indicators
-            # These are in all caps and don't contain hospital name patterns
-            # "ΠΕΙΡΑΙΑΣ" is a region indicator, not a hospital name
-            if line in ['ΠΕΙΡΑΙΑΣ', 'ΑΘΗΝΑ', 'ΠΕΡΙΣΤΕΡΙ']:
+            # ("Γ.Ν.Α." alone means "General Hospital of Athens") and bare
+            # area indicators like "ΠΕΙΡΑΙΑΣ"
+            if line in _BARE_PREFIXES or line in _AREA_LINES:
                 continue
 
             # Check if this line contains a known hospital abbreviation
-            matched = False
-            for abbr, full_name in self.HOSPITAL_NAMES.items():
-                if abbr in line:
-                    hospital_names.append(full_name)
-                    matched = True
-                    break
+            match = cls._HOSPITAL_RE.search(line)
+            if match:
+                hospital_names.append(cls.HOSPITAL_NAMES[match.group(0)])
+                continue
 
-            if not matched:
-                # If no match found but contains hospital prefixes, use cleaned text
-                # But make sure it has more than just the prefix
-                if any(prefix in line for prefix in ['Γ.Ν.', 'Π.Γ.Ν.', 'Ν.', 'Γ.Ο.Ν.Κ.']):
-                    # Make sure there's actual content beyond the prefix and punctuation
-                    cleaned = re.sub(r'^[ΓΠΝ\.Ο\.Κ\s]+', '', line)
-                    if cleaned and len(cleaned) > 3:
-                        hospital_names.append(line)
+            # If no match found but contains hospital prefixes, use cleaned text
+            # But make sure it has more than just the prefix
+            if _GENERIC_PREFIX_RE.search(line):
+                # Make sure there's actual content beyond the prefix and punctuation
+                cleaned = _PREFIX_RE.sub('', line)
+                if cleaned and len(cleaned) > 3:
+                    hospital_names.append(line)
 
         return hospital_names
 
@@ -304,14 +452,7 @@ class MOHHospitalScraper:
         """Get hospital duty schedule for a specific date"""
         # Format date to match file names
         # Files are named like "ΤΡΙΤΗ 14 ΟΚΤΩΒΡΙΟΥ 2025"
-        greek_months = {
-            1: "ΙΑΝΟΥΑΡΙΟΥ", 2: "ΦΕΒΡΟΥΑΡΙΟΥ", 3: "ΜΑΡΤΙΟΥ",
-            4: "ΑΠΡΙΛΙΟΥ", 5: "ΜΑΪΟΥ", 6: "ΙΟΥΝΙΟΥ",
-            7: "ΙΟΥΛΙΟΥ", 8: "ΑΥΓΟΥΣΤΟΥ", 9: "ΣΕΠΤΕΜΒΡΙΟΥ",
-            10: "ΟΚΤΩΒΡΙΟΥ", 11: "ΝΟΕΜΒΡΙΟΥ", 12: "ΔΕΚΕΜΒΡΙΟΥ"
-        }
-
-        date_str = f"{target_date.day} {greek_months[target_date.month]} {target_date.year}"
+        date_str = f"{target_date.day} {_GREEK_MONTHS[target_date.month]} {target_date.year}"
 
         # Get available files
         files = self.get_available_files()
@@ -329,6 +470,19 @@ class MOHHospitalScraper:
 
         fdl, file_type = matching_file
 
+        # Published files are immutable per fdl, so a previous parse of the
+        # same file can be reused outright - a JSON load instead of a
+        # download plus full table walk. JSON rather than pickle: the cache
+        # lives on disk between runs, and unpickling a tampered file would
+        # execute arbitrary code
+        cache_path = os.path.join(_user_cache_dir(), f"moh_parsed_{fdl}.json")
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, encoding='utf-8') as f:
+                    return [Hospital(**h) for h in json.load(f)]
+            except Exception:
+                pass  # corrupt/stale cache - fall through to a fresh parse
+
         # Download file
         content = self.download_file(fdl)
         if not content:
@@ -336,9 +490,31 @@ class MOHHospitalScraper:
 
         # Parse based on file type
         if file_type == 'pdf':
-            return self.parse_pdf(content, target_date.isoformat())
+            hospitals = self.parse_pdf(content, target_date.isoformat())
         else:
-            return self.parse_doc(content, target_date.isoformat())
+            hospitals = self.parse_doc(content, target_date.isoformat())
+
+        if hospitals:
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump([hospital_to_dict(h) for h in hospitals], f,
+                          ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+
+        return hospitals
+
+
+def _parse_page_tables(pdf_content: bytes, page_idx: int, duty_date: str) -> List[Hospital]:
+    """Extract and parse one page's tables (module-level so it pickles)"""
+    if fitz is not None:
+        # MuPDF's table finder runs in C, versus pdfminer's pure-Python
+        # layout analysis; both yield list[list[str]] rows
+        with fitz.open(stream=pdf_content, filetype="pdf") as doc:
+            tables = [tbl.extract() for tbl in doc[page_idx].find_tables().tables]
+    else:
+        with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
+            tables = pdf.pages[page_idx].extract_tables()
+    return MOHHospitalScraper._parse_tables(tables, duty_date)
 
 
 if __name__ == "__main__":
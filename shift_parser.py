@@ -6,13 +6,88 @@ Parses DOCX files containing cardiology attending and resident shifts
 
 import os
 import json
+import re
 from datetime import datetime, date
 from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from docx import Document
 
-
-@dataclass
+try:
+    import orjson
+except ImportError:  # optional - stdlib json handles the cache fine
+    orjson = None
+
+# Year token ("2025") in the document header - compiled once at import
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+_W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+_W_TR = f'{{{_W_NS}}}tr'
+_W_TC = f'{{{_W_NS}}}tc'
+_W_P = f'{{{_W_NS}}}p'
+_W_R = f'{{{_W_NS}}}r'
+_W_T = f'{{{_W_NS}}}t'
+_W_BR = f'{{{_W_NS}}}br'
+_W_CR = f'{{{_W_NS}}}cr'
+_W_TAB = f'{{{_W_NS}}}tab'
+_W_TCPR = f'{{{_W_NS}}}tcPr'
+_W_GRIDSPAN = f'{{{_W_NS}}}gridSpan'
+_W_VMERGE = f'{{{_W_NS}}}vMerge'
+_W_VAL = f'{{{_W_NS}}}val'
+
+
+def _para_text(p) -> str:
+    """Text of one paragraph, rendering breaks and tabs like run.text"""
+    parts = []
+    for r in p.iter(_W_R):
+        for el in r:
+            if el.tag == _W_T:
+                parts.append(el.text or '')
+            elif el.tag == _W_BR or el.tag == _W_CR:
+                parts.append('\n')
+            elif el.tag == _W_TAB:
+                parts.append('\t')
+    return ''.join(parts)
+
+
+def _fast_rows(table):
+    """
+    Yield each table row as a list of stripped cell strings
+
+    Walks the table's XML once instead of going through python-docx's
+    cell.text property, which rebuilds paragraph/run objects on every
+    access - a 31-day schedule table has a few hundred cells. Matches
+    row.cells semantics: paragraphs join with newlines, soft breaks and
+    tabs render as newline/tab, horizontal (gridSpan) merges repeat per
+    spanned column, and vertical (vMerge) continuations repeat the text
+    of the cell above. Only direct rows/cells are walked, so nested
+    tables don't leak into the outer grid
+    """
+    prev_cells = []
+    for tr in table._element.findall(_W_TR):
+        cells = []
+        for tc in tr.findall(_W_TC):
+            text = '\n'.join(
+                _para_text(p) for p in tc.findall(_W_P)
+            ).strip()
+
+            span = 1
+            tcpr = tc.find(_W_TCPR)
+            if tcpr is not None:
+                span_el = tcpr.find(_W_GRIDSPAN)
+                if span_el is not None:
+                    span = int(span_el.get(_W_VAL, 1))
+                vmerge = tcpr.find(_W_VMERGE)
+                if vmerge is not None and vmerge.get(_W_VAL, 'continue') == 'continue':
+                    # Continuation row of a vertical merge - row.cells
+                    # repeats the merged cell's text here
+                    grid_idx = len(cells)
+                    text = prev_cells[grid_idx] if grid_idx < len(prev_cells) else ''
+            cells.extend([text] * span)
+        prev_cells = cells
+        yield cells
+
+
+@dataclass(slots=True)
 class DailyShift:
     """Represents shifts for a single day"""
     day: int
@@ -82,6 +157,10 @@ class ShiftParser:
         "ΔΕΚΕΜΒΡΙΟΣ": 12, "ΔΕΚΕΜΒΡΙΟΥ": 12
     }
 
+    # All month spellings as one alternation - a single scan per paragraph
+    # instead of 24 substring probes
+    _MONTH_RE = re.compile('|'.join(GREEK_MONTHS))
+
     def __init__(self, docx_path: str):
         """Initialize parser with DOCX file path"""
         self.docx_path = docx_path
@@ -89,6 +168,7 @@ class ShiftParser:
         self.month_number: Optional[int] = None
         self.year: Optional[int] = None
         self.shifts: Dict[int, DailyShift] = {}  # day -> DailyShift
+        self._parsed_mtime: Optional[float] = None  # mtime of last parsed file
 
     def parse(self) -> bool:
         """
@@ -96,6 +176,11 @@ class ShiftParser:
         Returns True if successful, False otherwise
         """
         try:
+            # Re-parse only when the file actually changed on disk
+            mtime = os.path.getmtime(self.docx_path)
+            if self.shifts and mtime == self._parsed_mtime:
+                return True
+
             self.doc = Document(self.docx_path)
 
             # Extract month and year from document
@@ -114,6 +199,7 @@ class ShiftParser:
             self._parse_resident_table(self.doc.tables[1])
 
             print(f"✓ Επιτυχής ανάλυση: {len(self.shifts)} ημέρες για {self.month_number}/{self.year}")
+            self._parsed_mtime = mtime
             return True
 
         except Exception as e:
@@ -122,21 +208,20 @@ class ShiftParser:
 
     def _extract_month_year(self) -> bool:
         """Extract month and year from document paragraphs"""
-        # Look for patterns like "ΟΚΤΩΒΡΙΟΣ 2025"
-        for para in self.doc.paragraphs:
+        # Look for patterns like "ΟΚΤΩΒΡΙΟΣ 2025" - the header always sits
+        # at the top of the document, so only the first few paragraphs matter
+        for para in self.doc.paragraphs[:10]:
             text = para.text.strip().upper()
 
-            # Try to find month name and year
-            for month_name, month_num in self.GREEK_MONTHS.items():
-                if month_name in text:
-                    self.month_number = month_num
+            month_match = self._MONTH_RE.search(text)
+            if month_match:
+                self.month_number = self.GREEK_MONTHS[month_match.group(0)]
 
-                    # Extract year (4 consecutive digits)
-                    import re
-                    year_match = re.search(r'\b(20\d{2})\b', text)
-                    if year_match:
-                        self.year = int(year_match.group(1))
-                        return True
+                # Extract year (4 consecutive digits)
+                year_match = _YEAR_RE.search(text)
+                if year_match:
+                    self.year = int(year_match.group(1))
+                    return True
 
         return False
 
@@ -146,9 +231,7 @@ class ShiftParser:
         # Row 0+: [Day, Month, Weekday, Names]
         # Names can be multi-line, separated by newlines, with * for readiness
 
-        for row in table.rows:
-            cells = [cell.text.strip() for cell in row.cells]
-
+        for cells in _fast_rows(table):
             if len(cells) < 4:
                 continue
 
@@ -187,12 +270,10 @@ class ShiftParser:
         # Row 0: Headers [Day, Month, Weekday, ΜΕΓΑΛΕΣ, ΜΙΚΡΕΣ, ΤΕΠ, ΑΝΑΙΣΘ 1, ΑΝΑΙΣΘ 2, ΠΑΙΔΟΚΑΡΔ]
         # Row 1+: [Day, Month, Weekday, MajorName, MinorName, TEPName, Anest1, Anest2, PedCardio]
 
-        for i, row in enumerate(table.rows):
+        for i, cells in enumerate(_fast_rows(table)):
             if i == 0:  # Skip header row
                 continue
 
-            cells = [cell.text.strip() for cell in row.cells]
-
             if len(cells) < 6:
                 continue
 
@@ -257,12 +338,22 @@ class ShiftParser:
             'year': self.year,
             'last_update': datetime.now().isoformat(),
             'shifts': {
-                day: asdict(shift) for day, shift in self.shifts.items()
+                # Flat field copy - every field is a string/list, so
+                # asdict's recursive deepcopy walk buys nothing here
+                day: {f: getattr(shift, f) for f in DailyShift.__dataclass_fields__}
+                for day, shift in self.shifts.items()
             }
         }
 
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
+        if orjson is not None:
+            # Rust-native serializer; OPT_NON_STR_KEYS keeps the int day keys
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(
+                    data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(filepath, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, indent=2)
 
         print(f"✓ Εφημερίες αποθηκεύτηκαν στο {filepath}")
 
@@ -273,13 +364,15 @@ class ShiftParser:
             return None
 
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
             # Create a parser instance without file
             parser = cls.__new__(cls)
             parser.docx_path = None
             parser.doc = None
+            parser._parsed_mtime = None
             parser.month_number = data['month']
             parser.year = data['year']
             parser.shifts = {}
@@ -323,6 +416,37 @@ class ShiftParser:
         print(f"✓ Ενημερώθηκε η εφημερία της {day}/{self.month_number}")
         return True
 
+    def update_shift_fields(self, day: int, updates: Dict[str, str],
+                            filepath: Optional[str] = "shifts_cache.json") -> bool:
+        """
+        Update several fields of a shift in one transaction
+
+        Applies every field/value pair from `updates` (same field names as
+        update_shift), logs once, and writes the JSON cache once - instead
+        of one call and one potential save per field. Pass filepath=None to
+        skip the write, e.g. when the caller saves on its own schedule.
+        """
+        if day not in self.shifts:
+            print(f"✗ Δεν βρέθηκε εφημερία για την ημέρα {day}")
+            return False
+
+        shift = self.shifts[day]
+        for field, value in updates.items():
+            if field == 'attendings':
+                shift.attendings = [name.strip() for name in value.split(',') if name.strip()]
+            elif field in ['major_shift', 'minor_shift', 'tep_cardiologist',
+                           'senior_cardiac_surgeon', 'junior_cardiac_surgeon',
+                           'anesthesiologist_1', 'anesthesiologist_2', 'pediatric_cardiologist']:
+                setattr(shift, field, value.strip() if value.strip() else None)
+            else:
+                print(f"✗ Άγνωστο πεδίο: {field}")
+                return False
+
+        print(f"✓ Ενημερώθηκε η εφημερία της {day}/{self.month_number} ({len(updates)} πεδία)")
+        if filepath is not None:
+            self.save_to_json(filepath)
+        return True
+
 
 def test_parser():
     """Test function to demonstrate parser usage"""
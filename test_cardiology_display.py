@@ -22,7 +22,7 @@ def test_cardiology_data():
     # Filter for cardiology
     cardiology_hospitals = [
         h for h in all_hospitals
-        if "καρδιολογ" in h.specialty.lower() or "cardio" in h.specialty.lower()
+        if "καρδιολογ" in h.specialty_key or "cardio" in h.specialty_key
     ]
 
     print(f"Cardiology hospitals found: {len(cardiology_hospitals)}\n")
@@ -3,8 +3,21 @@
 Test script to verify the multi-column layout logic
 """
 
+import sys
+from itertools import groupby
+
 from moh_scraper import Hospital
-from typing import Dict, List
+
+# Constant tail of the report - folded once at module load
+_PALETTE_STR = """\
+Color Palette (Onassis Hospital):
+  Background: #11121F
+  Header: #041C2C
+  Card: #1a2332
+  Text: #ffffff
+  Accent: #00B179 (green)
+  Highlight: #005FBE (blue)
+  Secondary: #0094f0 (light blue)"""
 
 # Sample test data with different time slots
 test_hospitals = [
@@ -34,32 +47,43 @@ test_hospitals = [
     ),
 ]
 
-# Group by time slot
-by_time_slot: Dict[str, List[Hospital]] = {}
-for hospital in test_hospitals:
-    time_slot = hospital.time_slot or "Όλη την ημέρα"
-    if time_slot not in by_time_slot:
-        by_time_slot[time_slot] = []
-    by_time_slot[time_slot].append(hospital)
+def test_column_distribution():
+    """Group the fixture by time slot and check the round-robin layout"""
+    # Group by time slot - one sort, then groupby yields slots in order,
+    # same as the display's rendering path
+    slot_key = lambda h: h.time_slot or "Όλη την ημέρα"
+    test_hospitals.sort(key=slot_key)
+    sorted_slots = [
+        (time_slot, list(group))
+        for time_slot, group in groupby(test_hospitals, key=slot_key)
+    ]
+
+    # Test column distribution
+    num_columns = min(len(sorted_slots), 3)
+    col_indices = [i % num_columns for i in range(len(sorted_slots))]
 
-# Test column distribution
-sorted_slots = sorted(by_time_slot.items())
-num_columns = min(len(sorted_slots), 3)
+    # The four fixture hospitals cover three slots, one column each
+    assert col_indices == [0, 1, 2], f"Unexpected layout: {col_indices}"
+    assert [len(hs) for _, hs in sorted_slots] == [2, 1, 1]
 
-print(f"Total time slots: {len(sorted_slots)}")
-print(f"Columns to create: {num_columns}")
-print("\nColumn distribution:")
+    # Build the whole report and emit it with one write instead of a dozen
+    # print calls, each of which locks and flushes stdout
+    lines = [
+        f"Total time slots: {len(sorted_slots)}",
+        f"Columns to create: {num_columns}",
+        "",
+        "Column distribution:",
+        *(
+            f"  Column {col_idx}: {time_slot} ({len(hospitals)} hospitals)"
+            for col_idx, (time_slot, hospitals) in zip(col_indices, sorted_slots)
+        ),
+        "",
+        "✓ Layout logic test passed",
+        "",
+        _PALETTE_STR,
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
-for i, (time_slot, hospitals) in enumerate(sorted_slots):
-    col_idx = i % num_columns
-    print(f"  Column {col_idx}: {time_slot} ({len(hospitals)} hospitals)")
 
-print("\n✓ Layout logic test passed")
-print("\nColor Palette (Onassis Hospital):")
-print("  Background: #11121F")
-print("  Header: #041C2C")
-print("  Card: #1a2332")
-print("  Text: #ffffff")
-print("  Accent: #00B179 (green)")
-print("  Highlight: #005FBE (blue)")
-print("  Secondary: #0094f0 (light blue)")
+if __name__ == "__main__":
+    test_column_distribution()